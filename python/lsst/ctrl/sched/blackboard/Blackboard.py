@@ -32,6 +32,10 @@ from lsst.pex.logging import Log
 from lsst.utils.multithreading import LockProtected, SharedData
 
 import os
+from collections import namedtuple
+
+QueueLengths = namedtuple("QueueLengths", "dataAvailable jobsPossible " +
+                          "jobsAvailable jobsInProgress jobsDone pipelinesReady")
 
 class Blackboard(LockProtected):
     """
@@ -99,6 +103,20 @@ class Blackboard(LockProtected):
             self.queues.pipelinesReady = JobQueue(dir, self._log, lock)
 
         self._dbfail = 0
+
+    def queueLengths(self):
+        """
+        return the current lengths of all the queues, read while holding 
+        the queues lock just once.
+        @return QueueLengths   a named tuple with a field for each queue
+        """
+        with self.queues:
+            return QueueLengths(self.queues.dataAvailable.length(),
+                                self.queues.jobsPossible.length(),
+                                self.queues.jobsAvailable.length(),
+                                self.queues.jobsInProgress.length(),
+                                self.queues.jobsDone.length(),
+                                self.queues.pipelinesReady.length())
         
     def makeJobAvailable(self, job):
         """
@@ -92,6 +92,15 @@ class BlackboardItemQueue(_AbstractBase):
         @param item    the BlackboardItem to add
         """
         self._notImplemented("append")
+
+    def extend(self, items):
+        """
+        add each of the given BlackboardItems to the end of the queue, in
+        order.  This default implementation appends them one at a time.
+        @param items   the list of BlackboardItems to add
+        """
+        for item in items:
+            self.append(item)
         
     def insertAt(self, item, index=0):
         """
@@ -532,6 +541,48 @@ class _FSDBBlackboardQueue(BlackboardItemQueue):
                     raise BlackboardRollbackError(ex, rbex)
                 raise
 
+    def extend(self, items):
+        """
+        add each of the given BlackboardItems to the end of the queue, in
+        order.  
+
+        This implimentation rewrites the order file only once for the
+        entire list and attempts to be atomic: if any failure occurs,
+        none of the items are appended.
+
+        @param items   the list of BlackboardItems to add
+        """
+        with self._sd:
+            nfiles = len(self._sd.files)
+            added = []
+            try:
+                for item in items:
+                    file = self.filenameFor(item)
+                    pending = os.path.join(self._dbdir,
+                                           self.pendingAddFor(file))
+                    self._writeItem(item, pending)
+                    try:
+                        os.rename(pending, os.path.join(self._dbdir, file))
+                    except OSError:
+                        os.remove(pending)
+                        raise
+                    added.append(file)
+
+                self._sd.files.extend(added)
+                self._cacheOrder()
+
+            except Exception, ex:
+                # roll back changes
+                try:
+                    del self._sd.files[nfiles:]
+                    for file in added:
+                        os.remove(os.path.join(self._dbdir, file))
+                    self._cacheOrder()
+                except Exception, rbex:
+                    self._logRollbackFail(ex, rbex)
+                    raise BlackboardRollbackError(ex, rbex)
+                raise
+
     def _writeItem(self, item, path):
         # write the item file with a given name, returning the file's full path
         # Acquire self._sd before calling.
@@ -754,6 +805,14 @@ class InMemoryBlackboardQueue(BlackboardItemQueue):
         """
         self._items.append(item)
 
+    def extend(self, items):
+        """
+        add each of the given BlackboardItems to the end of the queue, in
+        order.
+        @param items   the list of BlackboardItems to add
+        """
+        self._items.extend(items)
+
     def insertAt(self, item, index=0):
         """
         insert a BlackboardItem at a given position in the queue.  If that
@@ -905,8 +964,7 @@ class TransactionalBlackboardQueue(BlackboardItemQueue, LockProtected):
 
     def _sync(self, fromq, toq):
         toq.removeAll()
-        for item in fromq.iterate():
-            toq.append(item)
+        toq.extend(fromq.iterate())
         
     def length(self):
         """
@@ -971,6 +1029,28 @@ class TransactionalBlackboardQueue(BlackboardItemQueue, LockProtected):
                 self._pending.append(self._Action("append", {"item": item}))
 
             self._memq.append(item)
+
+    def extend(self, items):
+        """
+        add each of the given BlackboardItems to the end of the queue, in
+        order.
+        @param items   the list of BlackboardItems to add
+        """
+        items = list(items)
+        with self._lp_lock:
+            if self._pending is None:
+                # commit right away
+                try:
+                    self._dskq.extend(items)
+                except Exception, ex:
+                    with self:
+                        self._rollback(self._dskq, ex)
+                    raise
+            else:
+                # add to pending
+                self._pending.append(self._Action("extend", {"items": items}))
+
+            self._memq.extend(items)
         
     def insertAt(self, item, index=0):
         """
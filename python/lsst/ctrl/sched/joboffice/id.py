@@ -101,11 +101,8 @@ class IDFilter(_AbstractBase):
         elif policy.isInt("min") or policy.isInt("lim") or policy.isInt("value"):
             clsname = "IntegerIDFilter"
 
-        cls = None
-        if IDFilter.classLookup.has_key(clsname):
-            cls = IDFilter.classLookup[clsname]
-
-        else:
+        cls = IDFilter.classLookup.get(clsname)
+        if cls is None:
             # lookup a fully qualified class
             raise RuntimeError("programmer error class name lookup not implemented")
 
@@ -121,7 +118,7 @@ class StringIDFilter(IDFilter):
         """
         create the filter
         @param name    the name of the identifier
-        @param values  the list of allowed values.
+        @param values  the list (or tuple) of allowed values.
         @param isstaticset  a flag indicating whether these parameters should
                          be considered a closed, static set of identifiers.
                          While by default this is set to True, it will be 
@@ -133,7 +130,7 @@ class StringIDFilter(IDFilter):
 
         self.values = None
         if values is not None:
-            if not isinstance(values, list):
+            if not isinstance(values, (list, tuple)):
                 values = [values]
             self.values = filter(lambda v: v is not None, values)
             bad = filter(lambda v: not isinstance(v, str), self.values)
@@ -213,9 +210,9 @@ class IntegerIDFilter(IDFilter):
         @param name    the name of the identifier
         @param min     the minimum identifier value recognized
         @param lim     one more than the maximum identifier value recognized
-        @param values  an arbitrary list of identifier values recognized.  
-                         These may be listed in addition to or instead of 
-                         a range.
+        @param values  an arbitrary list (or tuple) of identifier values
+                         recognized.  These may be listed in addition to or
+                         instead of a range.
         @param isstaticset  a flag indicating whether these parameters should
                          be considered a closed, static set of identifiers.
                          While by default this is set to True, it will be 
@@ -226,12 +223,14 @@ class IntegerIDFilter(IDFilter):
         self.isstatic = isstaticset
         self.range = (min, lim)
         self.values = None
+        self._valueset = frozenset()
         if values is not None:
-            if not isinstance(values, list):
+            if not isinstance(values, (list, tuple)):
                 values = [values]
             if len(filter(lambda v: not isinstance(v,int), values)) > 0:
                 raise ValueError("IntegerIDFilter: non-integer value given for values: " + str(self.values))
             self.values = list(values)
+            self._valueset = frozenset(self.values)
 
         if len(filter(lambda r: r is not None, self.range)) > 0 and \
            len(filter(lambda r: r is None, self.range)) > 0:
@@ -239,38 +238,57 @@ class IntegerIDFilter(IDFilter):
         if self.isUnconstrained():
             self.isstatic = False
 
+        self._accept = self._makeAcceptor()
+        self._allowed = None
+
+    def __getstate__(self):
+        # the acceptor is a closure, so rebuild it rather than pickle it
+        state = self.__dict__.copy()
+        del state["_accept"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._accept = self._makeAcceptor()
+
     def isUnconstrained(self):
-        return not self.values and not any(self.range)
+        return not self.values and self.range == (None, None)
 
     def recognize(self, id):
         """
         return an identifier value associated with the given input 
         identifier or None if the input is not recognized.
 
-        This implimentation returns the input identifier (as a string) 
+        This implimentation returns the input identifier (as an integer) 
         if it is recongized.
         """
         if not isinstance(id, int):
             try:
                 id = int(id)
-            except:
+            except (TypeError, ValueError, OverflowError):
                 return None
-        if self.isUnconstrained():
-            return id
-
-        if any(self.range):
-            if self.range[1] is None and id >= self.range[0]:
-                return id
-            elif self.range[0] is None and id < self.range[1]:
-                return id
-            elif id >= self.range[0] and id < self.range[1]:
-                return id
-
-        if self.values and id in self.values:
+        if self._accept(id):
             return id
-
         return None
 
+    def _makeAcceptor(self):
+        """
+        return a predicate on integer identifiers that only applies the 
+        tests needed for the constraints set on this filter.
+        """
+        min, lim = self.range
+        vals = self._valueset
+
+        if min is None and lim is None:
+            if vals:
+                return lambda id: id in vals
+            return lambda id: True
+        elif lim is None:
+            return lambda id: id >= min or id in vals
+        elif min is None:
+            return lambda id: id < lim or id in vals
+        return lambda id: min <= id < lim or id in vals
+
     def allowedValues(self):
         """
         return a list representing the complete set of values that will
@@ -281,15 +299,18 @@ class IntegerIDFilter(IDFilter):
         if nones == 1:
             raise RuntimeError("identifier set (%s) is not closed" % self.name)
 
-        if nones == 0:
-            out = range(self.range[0], self.range[1])
-        else:
-            out = []
-        if self.values:
-            out.extend(self.values)
-            out.sort()
-
-        return out
+        if self._allowed is None:
+            if nones == 0:
+                out = range(self.range[0], self.range[1])
+            else:
+                out = []
+            if self.values:
+                out.extend(self.values)
+                out.sort()
+            self._allowed = tuple(out)
+
+        # return a copy so that callers may modify it
+        return list(self._allowed)
 
     _dictionary = None
 
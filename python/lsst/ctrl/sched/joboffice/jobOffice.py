@@ -36,6 +36,7 @@ from lsst.daf.base import PropertySet
 from lsst.pex.logging import Log, BlockTimingLog
 from scheduler import DataTriggeredScheduler
 from lsst.ctrl.sched.utils import serializePolicy, unserializePolicy
+from lsst.ctrl.sched.utils import serializeDataset, serializeDatasetList
 
 import os, time, threading
 import traceback as tb
@@ -419,11 +420,12 @@ class _BaseJobOffice(JobOffice):
 
     def _logJobDone(self, jobevent):
         try: 
+            ps = jobevent.getPropertySet()
             self._debug("%s: %s on %s finished %s",
                         (jobevent.getStatus(),
-                         jobevent.getPropertySet().getString("pipelineName"),
+                         ps.getString("pipelineName"),
                          jobevent.getHostId(),
-                         (jobevent.getPropertySet().getBool("success") and
+                         (ps.getBool("success") and
                           "successfully") or "with failure"))
         except Exception, ex:
             self.log.log(Log.WARN, "logging error on " + jobevent.getStatus()
@@ -528,19 +530,29 @@ class _BaseJobOffice(JobOffice):
                          
         
     def receiveAnyDataEvent(self, timeout):
+        """
+        return the first data event available from any of the data topics
+        we are listening to, or None if none arrives within the timeout.
+        @param timeout   the maximum time to wait in milliseconds
+        """
         if not self.dataEvRcvrs:
             return None
         if len(self.dataEvRcvrs) == 1:
             return self.dataEvRcvrs[0].receiveStatusEvent(timeout)
         
+        # time.time() is in seconds; the receive timeouts are in milliseconds
         now = t0 = time.time()
         eachtimeout = timeout/len(self.dataEvRcvrs)/10
         if eachtimeout == 0:  eachtimeout = 1
-        while (now - t0 < timeout):
+        while True:
             # take a tenth of the total timeout time to go through list
             for rcvr in self.dataEvRcvrs:
-                rcvr.receiveStatusEvent(eachtimeout)
+                event = rcvr.receiveStatusEvent(eachtimeout)
+                if event:
+                    return event
             now = time.time()
+            if 1000 * (now - t0) >= timeout:
+                return None
 
     def processDataEvent(self, event):
         """
@@ -601,11 +613,11 @@ class _BaseJobOffice(JobOffice):
         commence working on the given job.
         """
         props = PropertySet()
-        for ds in job.getInputDatasets():
-            props.add("inputs", serializePolicy(ds.toPolicy()))
-        for ds in job.getOutputDatasets():
-            props.add("outputs", serializePolicy(ds.toPolicy()))
-        props.set("identity", serializePolicy(job.getJobIdentity().toPolicy()))
+        for name, datasets in (("inputs", job.getInputDatasets()),
+                               ("outputs", job.getOutputDatasets())):
+            for dsstr in serializeDatasetList(datasets):
+                props.add(name, dsstr)
+        props.set("identity", serializeDataset(job.getJobIdentity()))
         props.set("STATUS", "job:assign")
         props.set("name", job.getName())
         return CommandEvent(runId, self.originatorId, pipeline, props)
@@ -709,19 +721,25 @@ class DataTriggeredJobOffice(_BaseJobOffice):
     def processDataEvent(self, event):
         """
         process an event indicating that one or more datasets are available.
+        If one of the datasets cannot be decoded, the datasets that precede
+        it in the event are still scheduled before the error is raised.
         @param event    the data event.  
         @return bool    true if the event was processed.
         """
         statusEvent = self.makeJobOfficeStatusEvent(event.getRunId(), "joboffice:datareceived")
         self.jobOfficeStatusEvTrx.publishEvent(statusEvent)
-        out = 0
         dsps = event.getPropertySet().getArrayString("dataset")
-        for dsp in dsps:
-            ds = self.datasetFromProperty(dsp)
-            self._logDataReady(ds)
-            if self.scheduler.processDataset(ds):
-                out += 1
-        return out
+        dss = []
+        try:
+            for dsp in dsps:
+                ds = self.datasetFromProperty(dsp)
+                self._logDataReady(ds)
+                dss.append(ds)
+        except RuntimeError:
+            # schedule the datasets that did decode before passing on the error
+            self.scheduler.processDatasets(dss)
+            raise
+        return self.scheduler.processDatasets(dss)
 
         # wait until all events are processed
         #   self.scheduler.makeJobsAvailable()
@@ -733,12 +751,15 @@ class DataTriggeredJobOffice(_BaseJobOffice):
         """
         convert the given string-encoded policy data into a Dataset
         @param policystr   the policy data written into a string in PAF format.
+                             An already parsed Policy is also accepted.
         """
         try:
-            pol = unserializePolicy(policystr)
+            pol = policystr
+            if not isinstance(pol, Policy):
+                pol = unserializePolicy(policystr)
             return Dataset.fromPolicy(pol)
         except lsst.pex.exceptions.LsstCppException, ex:
-            raise RuntimeError("Dataset encoding error: " + policystr)
+            raise RuntimeError("Dataset encoding error: " + str(policystr))
             
     def toPipelineQueueItem(self, pevent):
         """
@@ -747,8 +768,9 @@ class DataTriggeredJobOffice(_BaseJobOffice):
         props = { "ipid": pevent.getIPId(),
                   "status":  pevent.getStatus() }
         pipename = "unknown"
-        if pevent.getPropertySet().exists("pipelineName"):
-            pipename = pevent.getPropertySet().getString("pipelineName")
+        ps = pevent.getPropertySet()
+        if ps.exists("pipelineName"):
+            pipename = ps.getString("pipelineName")
         pipe = PipelineItem.createItem(pipename, pevent.getRunId(),
                                        pevent.getOriginatorId(), props)
                           
@@ -69,7 +69,7 @@ class Scheduler(_AbstractBase):
         self.bb = blackboard
         self.log = logger
 
-    def processDataset(self, dataset, success):
+    def processDataset(self, dataset, success=None):
         """
         note that the given trigger dataset is now available and update
         the jobs on the jobsPossible queue.  A trigger dataset is a dataset
@@ -78,7 +78,43 @@ class Scheduler(_AbstractBase):
         place new jobs on the jobsPossible list based on the availability of
         this dataset.
         @param dataset    the trigger dataset that is now available.
+        @param success    True if the dataset was successfully created.  If
+                             None (default), the dataset valid flag will be
+                             the indicator of success.
+        @return bool   True if the dataset was needed by this scheduler
+        """
+        return self._processDataset(dataset, success)
+
+    def processDatasets(self, datasets, success=None):
+        """
+        note that each of the given trigger datasets is now available,
+        updating the jobsPossible queue as processDataset() does.  The
+        blackboard queues are locked once for the entire list, and the
+        needed datasets are added to the dataAvailable queue in one step.
+        @param datasets   the list of trigger datasets that are now available
+        @param success    True if the datasets were successfully created.  If
+                             None (default), each dataset's valid flag will
+                             be the indicator of success.
+        @return int   the number of datasets that were recognized as needed
+        """
+        products = []
+        queues = self.bb.queues
+        with queues:
+            for dataset in datasets:
+                self._processDataset(dataset, success, products)
+            if products:
+                queues.dataAvailable.extend(products)
+        return len(products)
+
+    def _processDataset(self, dataset, success, products=None):
+        """
+        implement processDataset().  
+        @param dataset    the trigger dataset that is now available.
         @param success    True if the dataset was successfully created.
+        @param products   if not None, a list to which the DataProductItem
+                             for a needed dataset is appended instead of
+                             adding it to the dataAvailable queue.
+        @return bool   True if the dataset was needed by this scheduler
         """
         self._notImplemented("processDataset")
 
@@ -101,9 +137,10 @@ class Scheduler(_AbstractBase):
         datasets have been seen via processDataset().
         """
         with self.bb:
+            jobsPossible = self.bb.queues.jobsPossible
             ready = []
-            for i in xrange(self.bb.queues.jobsPossible.length()):
-                job = self.bb.queues.jobsPossible.get(i)
+            for i in xrange(jobsPossible.length()):
+                job = jobsPossible.get(i)
                 if job.isReady():
                     ready.append(job)
 
@@ -188,18 +225,18 @@ class DataTriggeredScheduler(Scheduler):
             self.jobRetries = policy.getInt("job.retries")
 
 
-    def processDataset(self, dataset, success=None):
+    def _processDataset(self, dataset, success=None, products=None):
         """
         note that the given trigger dataset is now available and update
-        the jobs on the jobsPossible queue.  A trigger dataset is a dataset
-        that must be made available before a job can start.  This function
-        is thus responsible for recording this fact.  This function may also
-        place new jobs on the jobsPossible list based on the availability of
-        this dataset.
+        the jobs on the jobsPossible queue (see processDataset()).
         @param dataset    the trigger dataset that is now available.
         @param success    True if the dataset was successfully created.  If
                              None (default), the dataset valid flag will be
                              the indicator of success.
+        @param products   if not None, a list to which the DataProductItem
+                             for the dataset is appended instead of adding
+                             it to the dataAvailable queue.
+        @return bool   True if the dataset was needed by this scheduler
         """
 
         # determine if this is a trigger dataset
@@ -215,17 +252,19 @@ class DataTriggeredScheduler(Scheduler):
         if success is None:
             success = dataset.valid
 
-        with self.bb.queues:
-            product = DataProductItem.createItem(dataset, success)
-            self.bb.queues.dataAvailable.append(product)
-
-        with self.bb.queues:
+        product = DataProductItem.createItem(dataset, success)
+        queues = self.bb.queues
+        with queues:
+            if products is None:
+                queues.dataAvailable.append(product)
+            else:
+                products.append(product)
 
             # determine if this job is needed by any jobs in the
             # jobPossible queue
             needed = False
-            for i in xrange(self.bb.queues.jobsPossible.length()):
-                job = self.bb.queues.jobsPossible.get(i)
+            for i in xrange(queues.jobsPossible.length()):
+                job = queues.jobsPossible.get(i)
 
                 if job.setNeededDataset(recognized):
                     needed = True
@@ -249,7 +288,9 @@ class DataTriggeredScheduler(Scheduler):
                 
                 job = JobItem.createItem(jobds, name, inputs,outputs, trighdlr, retries=self.jobRetries)
                 job.setNeededDataset(recognized)
-                self.bb.queues.jobsPossible.append(job)
+                queues.jobsPossible.append(job)
+
+        return True
 
     def _determineJobIdentity(self, outputs, inputs=None):
         # return an identifier for the job implied by the outputs and inputs.
@@ -359,18 +400,18 @@ class ButlerTriggeredScheduler(Scheduler):
             self.nametmpl = pol.getString("template")
         self.nameNumber = pol.getInt("initCounter")
 
-    def processDataset(self, dataset, success=None):
+    def _processDataset(self, dataset, success=None, products=None):
         """
         note that the given trigger dataset is now available and update
-        the jobs on the jobsPossible queue.  A trigger dataset is a dataset
-        that must be made available before a job can start.  This function
-        is thus responsible for recording this fact.  This function may also
-        place new jobs on the jobsPossible list based on the availability of
-        this dataset.
+        the jobs on the jobsPossible queue (see processDataset()).
         @param dataset    the trigger dataset that is now available.
         @param success    True if the dataset was successfully created.  If
                              None (default), the dataset valid flag will be
                              the indicator of success.
+        @param products   if not None, a list to which the DataProductItem
+                             for the dataset is appended instead of adding
+                             it to the dataAvailable queue.
+        @return bool   True if the dataset was needed by this scheduler
         """
 
         # determine what jobs this dataset is a prerequisite for
@@ -385,18 +426,21 @@ class ButlerTriggeredScheduler(Scheduler):
         if success is None:
             success = dataset.valid
 
-        with self.bb.queues:
-            product = DataProductItem.createItem(dataset, success)
-            self.bb.queues.dataAvailable.append(product)
-
-        with self.bb.queues:
+        product = DataProductItem.createItem(dataset, success)
+        queues = self.bb.queues
+        with queues:
+            if products is None:
+                queues.dataAvailable.append(product)
+            else:
+                products.append(product)
 
             # iterate over jobs and determine if it has been referenced
             # before
+            jobsPossible = queues.jobsPossible
             for jobid in jobs:
                 found = False
-                for i in xrange(self.bb.queues.jobsPossible.length()):
-                    candidate = self.bb.queues.jobsPossible.get(i)
+                for i in xrange(jobsPossible.length()):
+                    candidate = jobsPossible.get(i)
         
                     if jobid == candidate.getJobIdentity():
                         found = True
@@ -426,7 +470,9 @@ class ButlerTriggeredScheduler(Scheduler):
                     candidate = JobItem.createItem(jobid, name, inputs,outputs,
                                                    trighdlr)
                     candidate.setNeededDataset(dataset)
-                    self.bb.queues.jobsPossible.append(candidate)
+                    jobsPossible.append(candidate)
+
+        return True
                     
     def createName(self, jobid):
         """
@@ -32,7 +32,7 @@ from id import IDFilter
 from lsst.ctrl.sched import Dataset, utils
 from lsst.ctrl.sched.base import _AbstractBase
 
-import os, copy
+import os, copy, itertools
 import importlib
 
 # NOTE:  the two trigger implementations do not use the Trigger API in
@@ -184,18 +184,14 @@ class SimpleTrigger(Trigger):
             
             # iterate through the identifier filters, passing through
             # the appropriate identifiers from the dataset
-            for idname in self.idfilts.keys():
-                if not dataset.ids.has_key(idname):
+            for idname, filts in self.idfilts.iteritems():
+                if idname not in dataset.ids:
                     return None
                 
                 # we're looking for this one; the identifier is 
                 # recognized if any of filters return True
-                recognized = False
-                for filt in self.idfilts[idname]:
-                    if filt.recognize(dataset.ids[idname]) is not None:
-                        recognized = True
-                        break
-                if not recognized:
+                value = dataset.ids[idname]
+                if not any(filt.recognize(value) is not None for filt in filts):
                     return None
 
         # all tests pass; return this dataset
@@ -264,20 +260,15 @@ class SimpleTrigger(Trigger):
         out = []
         if len(idnames) > 0:
 
-            # iterate through all combinations of allowed id values.
-            # The total number of datasets returned will then
-            # be len(types) * PI(valcnt.values())
-            valcnt = {}
-            for id in idnames:
-                valcnt[id] = len(idvals[id])
+            # iterate through all combinations of allowed id values, with
+            # the first identifier varying fastest.  The total number of
+            # datasets returned will then be len(types) times the product of
+            # the numbers of allowed values.
+            idnames.reverse()
+            combos = list(itertools.product(*[idvals[id] for id in idnames]))
 
             for type in types:
-                # initialize our multidimensional iterator
-                iter = valcnt.fromkeys(idnames, 0)
-
-                # quit adding when the last axis of the iterator meets its
-                # limit
-                while iter[idnames[-1]] < valcnt[idnames[-1]]:
+                for combo in combos:
 
                     # clone the template
                     ds = copy.deepcopy(template)
@@ -286,19 +277,9 @@ class SimpleTrigger(Trigger):
                         ds.ids = {}
 
                     # set the values of the identifiers in the dataset
-                    for id in iter.keys():
-                        ds.ids[id] = idvals[id][iter[id]]
+                    ds.ids.update(zip(idnames, combo))
                     out.append(ds)
 
-                    # increment the iterator
-                    for i in xrange(len(idnames)):
-                        iter[idnames[i]] += 1
-                        if iter[idnames[i]] < valcnt[idnames[i]]:
-                            break
-                        if i == len(idnames) - 1:
-                            break
-                        iter[idnames[i]] = 0
-
         else:
             # this trigger places no constaints on the files; return a
             # single dataset list based entirely on template
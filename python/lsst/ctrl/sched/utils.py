@@ -31,7 +31,7 @@ from lsst.daf.base import PropertySet
 from lsst.ctrl.sched import Dataset
 from lsst.pex.policy import Policy, PolicyString, PAFWriter
 
-import os, time, random
+import os, time, random, socket
 
 def serializePolicy(policy):
     """
@@ -68,24 +68,48 @@ def serializeDatasetList(datalist):
     convert a list of Datasets into a list of PAF-encoded strings.  This is
     useful for encoding Dataset data into PropertySets.
     """
-    return map(lambda d: serializeDataset(d), datalist)
+    return [serializeDataset(d) for d in datalist]
 
 def unserializeDatasetList(dstrlist):
     """
     convert a list of PAF-encoded strings into a list of Datasets.  This is
     the opposite of serializeDatasetList().
     """
-    return map(lambda d: unserializeDataset(d), dstrlist)
+    return [unserializeDataset(d) for d in dstrlist]
 
 
-def createRunId(base="test", lim=100000):
+def createRunId(base="test", lim=100000, seq=None):
     """
     create unique run identifier
     @param base   use this as an identifier prefix
+    @param lim    the upper limit (exclusive) of the numeric suffix
+    @param seq    if given, use this number (modulo lim) as the suffix
+                     instead of a random one.  Passing successive numbers
+                     guarantees distinct identifiers.
     """
+    if seq is None:
+        seq = random.randrange(lim)
     width = len(str(lim))-1
     fmt = "%%s%%0%dd" % width
-    return fmt % (base, random.randrange(lim))
+    return fmt % (base, seq % lim)
+
+def brokerReachable(host, port=61616, timeout=0.25):
+    """
+    return True if a connection can be opened to the event broker.  This
+    is useful for skipping work (e.g. tests) that requires a live broker.
+    @param host     the hostname where the event broker is running
+    @param port     the port the broker is listening on
+    @param timeout  the number of seconds to wait for the connection
+    """
+    sock = socket.socket()
+    sock.settimeout(timeout)
+    try:
+        sock.connect((host, port))
+        return True
+    except socket.error:
+        return False
+    finally:
+        sock.close()
     
 
 class EventSender(object):
@@ -180,13 +204,11 @@ class EventSender(object):
         if inputs:
             if not isinstance(inputs, list):
                 inputs = [inputs]
-            for ds in inputs:
-                out.addDataset("inputs", ds)
-        if inputs:
+            out.addDatasets("inputs", inputs)
+        if outputs:
             if not isinstance(outputs, list):
                 outputs = [outputs]
-            for ds in outputs:
-                out.addDataset("outputs", ds)
+            out.addDatasets("outputs", outputs)
 
         return out
 
@@ -229,8 +251,7 @@ class EventSender(object):
         if datasets:
             if not isinstance(datasets, list):
                 datasets = [datasets]
-            for ds in datasets:
-                out.addDataset("dataset", ds)
+            out.addDatasets("dataset", datasets)
 
         return out
     
@@ -272,6 +293,10 @@ class _EventFactory(object):
     def addDataset(self, propname, ds):
         """add a dataset to the event"""
         self.props.add(propname, serializeDataset(ds))
+    def addDatasets(self, propname, datasets):
+        """add a list of datasets to the event"""
+        for dsstr in serializeDatasetList(datasets):
+            self.props.add(propname, dsstr)
     def getDatasets(self, propname):
         """return the datasets attached to the event"""
         return unserializeDatasetList(self.props.getArrayString(propname))
@@ -326,15 +351,24 @@ class _CommandEventFactory(_StatusEventFactory):
         """set the value of the destination ID"""
         self.destid = val
 
+_importedClasses = {}
+
 def importClass(clsname):
     """
-    return a class object with the given fully-qualified name.
+    return a class object with the given fully-qualified name.  Classes
+    that have been successfully imported are cached by name.
     """
+    cls = _importedClasses.get(clsname)
+    if cls is not None:
+        return cls
+
     # split into package and unqualified name
     pathtokens = clsname.rsplit('.', 1) 
     unqualified = pathtokens.pop().strip()
     package = pathtokens[0]
 
     clsmod = __import__(package, globals(), locals(), [unqualified], -1)
-    return getattr(clsmod, unqualified)
+    cls = getattr(clsmod, unqualified)
+    _importedClasses[clsname] = cls
+    return cls
 
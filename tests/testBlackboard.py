@@ -106,6 +106,20 @@ class BlackboardTestCase(unittest.TestCase):
         itemfile = os.path.join(self.bbdir,"dataAvailable","v1234-s0.fits.paf")
         self.assert_(os.path.exists(itemfile))
         
+    def testQueueLengths(self):
+        self.assertEquals(self.bb.queueLengths(), (0, 0, 0, 0, 0, 0))
+
+        with self.bb:
+            self.bb.queues.dataAvailable.append(
+                self._datasetItem("v1234-s0.fits", "raw"))
+            self.bb.queues.jobsPossible.append(self._jobItem("v1234"))
+
+        qlen = self.bb.queueLengths()
+        self.assertEquals(qlen.dataAvailable, 1)
+        self.assertEquals(qlen.jobsPossible, 1)
+        self.assertEquals(qlen.jobsAvailable, 0)
+        self.assertEquals(qlen.pipelinesReady, 0)
+        
     def testAddJob(self):
         item = self._jobItem("v1234")
         with self.bb:
@@ -59,6 +59,7 @@ class AbsBBItemQTestCase(unittest.TestCase):
         self.assertRaises(RuntimeError, q.get, 0)
         self.assertRaises(RuntimeError, q.pop)
         self.assertRaises(RuntimeError, q.append, None)
+        self.assertRaises(RuntimeError, q.extend, [None])
         self.assertRaises(RuntimeError, q.insertAt, None)
         self.assertRaises(RuntimeError, q.insert, None)
         self.assertRaises(RuntimeError, q.transferNextTo, q, 0)
@@ -203,6 +204,17 @@ class InMemoryBBQueueTestCase(unittest.TestCase):
         self.assertEquals(self.q.length(), 1)
         self.assert_(not self.q.isEmpty())
 
+    def testExtend(self):
+        self.q.append(self._newItem("item1", {"pos": 1}))
+        self.q.extend([self._newItem("item2", {"pos": 2}),
+                       self._newItem("item2", {"pos": 3})])
+        self.assertEquals(self.q.length(), 3)
+        for i in xrange(3):
+            self.assertEquals(self.q.get(i)["pos"], i+1)
+
+        self.q.extend([])
+        self.assertEquals(self.q.length(), 3)
+
     def testGet(self):
         self.q.append(self._newItem("item1", {"pos": 1}))
         self.q.append(self._newItem("item2", {"pos": 2}))
@@ -461,6 +473,16 @@ class FSQueueBaseTestCase(InMemoryBBQueueTestCase):
             self.assertEquals(files[1], "item1.1.paf")
             self.assertEquals(files[2], "item3.paf")
         
+    def _diskQueue(self):
+        # the queue that keeps the order file on disk
+        return self.q
+
+    def testExtend(self):
+        InMemoryBBQueueTestCase.testExtend(self)
+
+        self.assertEquals(self._diskQueue()._loadOrder(),
+                          ["item1.paf", "item2.paf", "item2.1.paf"])
+        
     def testTransfer(self):
         self.assert_(not os.path.exists(self.dbdir+"2"))
         other = _PolicyBlackboardQueue(self.dbdir+"2")
@@ -515,6 +537,25 @@ class TransactionalBBQueueTestCase(FSQueueBaseTestCase):
         persistq = _PolicyBlackboardQueue(self.dbdir)
         self.q = bbq.TransactionalBlackboardQueue(persistq)
 
+    def _diskQueue(self):
+        return self.q._dskq
+
+    def testExtendInTransaction(self):
+        self.q.append(self._newItem("item1", {"pos": 1}))
+
+        with self.q:
+            self.q.extend([self._newItem("item2", {"pos": 2}),
+                           self._newItem("item3", {"pos": 3})])
+            self.assertEquals(self.q.length(), 3)
+            self.assertEquals(self.q._rbq.length(), 1)
+            self.assertEquals(self.q._dskq.length(), 1)
+
+        self.assert_(self.q._rbq is None)
+        self.assertEquals(self.q.length(), 3)
+        self.assertEquals(self.q._dskq.length(), 3)
+        self.assertEquals(self.q._dskq._loadOrder(),
+                          ["item1.paf", "item2.paf", "item3.paf"])
+
     def testTransaction(self):
         self.q.append(self._newItem("item1", {"pos": 1}))
         self.q.append(self._newItem("item2", {"pos": 2}))
@@ -641,6 +682,9 @@ class PolicyBBQueueTestCase(FSQueueBaseTestCase):
         self.dbdir = os.path.join(testdir, "testqueue")
         self.q = bb.BasicBlackboardQueue(self.dbdir)
 
+    def _diskQueue(self):
+        return self.q._dskq
+
     def _newItem(self, name, data=None):
         return self.q.createItem(name, data)
 
@@ -27,152 +27,125 @@ Tests of the Dataset class
 """
 from __future__ import with_statement
 
-import pdb                              # we may want to say pdb.set_trace()
-import os
-import sys
 import unittest
-import time
 
 from lsst.ctrl.sched import Dataset
 from lsst.pex.policy import Policy
 
+TYPE = "CalExp"
+PATH = "goob/CalExp-v88-c12.fits"
+CCDID = 12
+VISITID = 88
+
 class DatasetTestCase(unittest.TestCase):
 
-    def setUp(self):
-        pass
-    def tearDown(self):
-        pass
+    @classmethod
+    def setUpClass(cls):
+        cls._pTemplate = Policy()
+        cls._pTemplate.set("type", TYPE)
 
     def testCtor(self):
-        type = "CalExp"
-        path = "goob/CalExp-v88-c12.fits"
-        ccdid = 12
-        visitid = 88
-
-        ds = Dataset(type)
-        self.assertEquals(ds.type, type)
-        self.assert_(ds.path is None)
-        self.assert_(ds.ids is None)
-
-        ds = Dataset(type, path)
-        self.assertEquals(ds.type, type)
-        self.assertEquals(ds.path, path)
-        self.assert_(ds.ids is None)
-
-        ds = Dataset(type, ccdid=ccdid, visitid=visitid)
-        self.assertEquals(ds.type, type)
-        self.assert_(ds.path is None)
-        self.assert_(ds.ids is not None)
-        self.assertEquals(ds.ids["ccdid"], ccdid)
-        self.assertEquals(ds.ids["visitid"], visitid)
-
-        # pdb.set_trace()
-        ds = Dataset(type, path, False, {"ccdid": ccdid, "visitid": visitid })
-        self.assertEquals(ds.type, type)
-        self.assertEquals(ds.path, path)
-        self.assert_(not ds.valid)
-        self.assert_(ds.ids is not None)
-        self.assertEquals(ds.ids["ccdid"], ccdid)
-        self.assertEquals(ds.ids["visitid"], visitid)
-
-        ds = Dataset(type, ids={"ccdid": ccdid, "visitid": visitid })
-        self.assertEquals(ds.type, type)
-        self.assert_(ds.path is None)
-        self.assert_(ds.ids is not None)
-        self.assertEquals(ds.ids["ccdid"], ccdid)
-        self.assertEquals(ds.ids["visitid"], visitid)
+        ds = Dataset(TYPE)
+        self.assertEqual(ds.type, TYPE)
+        self.assertIsNone(ds.path)
+        self.assertIsNone(ds.ids)
+
+        ds = Dataset(TYPE, PATH)
+        self.assertEqual(ds.type, TYPE)
+        self.assertEqual(ds.path, PATH)
+        self.assertIsNone(ds.ids)
+
+        ds = Dataset(TYPE, ccdid=CCDID, visitid=VISITID)
+        self.assertEqual(ds.type, TYPE)
+        self.assertIsNone(ds.path)
+        self.assertIsNotNone(ds.ids)
+        self.assertEqual(ds.ids["ccdid"], CCDID)
+        self.assertEqual(ds.ids["visitid"], VISITID)
+
+        ds = Dataset(TYPE, PATH, False, {"ccdid": CCDID, "visitid": VISITID })
+        self.assertEqual(ds.type, TYPE)
+        self.assertEqual(ds.path, PATH)
+        self.assertFalse(ds.valid)
+        self.assertIsNotNone(ds.ids)
+        self.assertEqual(ds.ids["ccdid"], CCDID)
+        self.assertEqual(ds.ids["visitid"], VISITID)
+
+        ds = Dataset(TYPE, ids={"ccdid": CCDID, "visitid": VISITID })
+        self.assertEqual(ds.type, TYPE)
+        self.assertIsNone(ds.path)
+        self.assertIsNotNone(ds.ids)
+        self.assertEqual(ds.ids["ccdid"], CCDID)
+        self.assertEqual(ds.ids["visitid"], VISITID)
 
     def testToString(self):
-        type = "CalExp"
-        path = "goob/CalExp-v88-c12.fits"
-        ccdid = 12
-        visitid = 88
-
-        ds = Dataset(type, ids={"ccdid": ccdid, "visitid": visitid })
-        self.assertEquals(ds.toString(),
-                          "%s-ccdid%s-visitid%s" % (type, ccdid, visitid))
+        ds = Dataset(TYPE, ids={"ccdid": CCDID, "visitid": VISITID })
+        self.assertEqual(ds.toString(),
+                         "%s-ccdid%s-visitid%s" % (TYPE, CCDID, VISITID))
         # print str(ds)
 
     def testFromPolicy(self):
-        type = "CalExp"
-        path = "goob/CalExp-v88-c12.fits"
-        ccdid = 12
-        visitid = 88
-
-        p = Policy()
-        p.set("type", type)
-        # pdb.set_trace()
+        p = Policy(self._pTemplate, True)
         ds = Dataset.fromPolicy(p)
-        self.assertEquals(ds.type, type)
-        self.assert_(ds.path is None)
-        self.assert_(ds.ids is None)
+        self.assertEqual(ds.type, TYPE)
+        self.assertIsNone(ds.path)
+        self.assertIsNone(ds.ids)
 
-        p.set("path", path)
+        p.set("path", PATH)
         ds = Dataset.fromPolicy(p)
-        self.assertEquals(ds.type, type)
-        self.assertEquals(ds.path, path)
-        self.assert_(ds.ids is None)
+        self.assertEqual(ds.type, TYPE)
+        self.assertEqual(ds.path, PATH)
+        self.assertIsNone(ds.ids)
 
-        p.set("ids.ccdid", ccdid)
-        p.set("ids.visitid", visitid)
+        p.set("ids.ccdid", CCDID)
+        p.set("ids.visitid", VISITID)
         ds = Dataset.fromPolicy(p)
-        self.assertEquals(ds.type, type)
-        self.assertEquals(ds.path, path)
-        self.assert_(ds.ids is not None)
-        self.assertEquals(ds.ids["ccdid"], ccdid)
-        self.assertEquals(ds.ids["visitid"], visitid)
+        self.assertEqual(ds.type, TYPE)
+        self.assertEqual(ds.path, PATH)
+        self.assertIsNotNone(ds.ids)
+        self.assertEqual(ds.ids["ccdid"], CCDID)
+        self.assertEqual(ds.ids["visitid"], VISITID)
 
     def testToPolicy(self):
-        type = "CalExp"
-        path = "goob/CalExp-v88-c12.fits"
-        ccdid = 12
-        visitid = 88
-
-        orig = Dataset(type, path, ccdid=ccdid, visitid=visitid)
+        orig = Dataset(TYPE, PATH, ccdid=CCDID, visitid=VISITID)
         pol = orig.toPolicy()
         ds = Dataset.fromPolicy(pol)
-        self.assertEquals(ds.type, type)
-        self.assertEquals(ds.path, path)
-        self.assert_(ds.ids is not None)
-        self.assertEquals(ds.ids["ccdid"], ccdid)
-        self.assertEquals(ds.ids["visitid"], visitid)
+        self.assertEqual(ds.type, TYPE)
+        self.assertEqual(ds.path, PATH)
+        self.assertIsNotNone(ds.ids)
+        self.assertEqual(ds.ids["ccdid"], CCDID)
+        self.assertEqual(ds.ids["visitid"], VISITID)
 
     def testEquals(self):
-        type = "CalExp"
-        path = "goob/CalExp-v88-c12.fits"
-        ccdid = 12
-        visitid = 88
-
-        ds1 = Dataset(type, path, ccdid=ccdid, visitid=visitid)
-        ds2 = Dataset(type, path, ccdid=ccdid, visitid=visitid)
-        self.assert_(ds1 == ds2)
-        self.assertEquals(ds1, ds2)
-        self.assertEquals(ds2, ds1)
-        self.assert_(ds1 in [ds2])
+        ds1 = Dataset(TYPE, PATH, ccdid=CCDID, visitid=VISITID)
+        ds2 = Dataset(TYPE, PATH, ccdid=CCDID, visitid=VISITID)
+        self.assertTrue(ds1 == ds2)
+        self.assertEqual(ds1, ds2)
+        self.assertEqual(ds2, ds1)
+        self.assertIn(ds1, [ds2])
 
         ds2.ids["ccdid"] += 1
-        self.assertNotEquals(ds1, ds2)
-        self.assertNotEquals(ds2, ds1)
-        self.assert_(ds1 not in [ds2])
+        self.assertNotEqual(ds1, ds2)
+        self.assertNotEqual(ds2, ds1)
+        self.assertNotIn(ds1, [ds2])
 
-        ds2 = Dataset(type, path, ccdid=ccdid, visitid=visitid, ampid=5)
-        self.assertNotEquals(ds1, ds2)
-        self.assertNotEquals(ds2, ds1)
+        ds2 = Dataset(TYPE, PATH, ccdid=CCDID, visitid=VISITID, ampid=5)
+        self.assertNotEqual(ds1, ds2)
+        self.assertNotEqual(ds2, ds1)
         
-        ds2 = Dataset("junk", path, ccdid=ccdid, visitid=visitid)
-        self.assertNotEquals(ds1, ds2)
-        self.assertNotEquals(ds2, ds1)
+        ds2 = Dataset("junk", PATH, ccdid=CCDID, visitid=VISITID)
+        self.assertNotEqual(ds1, ds2)
+        self.assertNotEqual(ds2, ds1)
 
-        ds2 = Dataset(type)
-        self.assertNotEquals(ds1, ds2)
-        self.assertNotEquals(ds2, ds1)
+        ds2 = Dataset(TYPE)
+        self.assertNotEqual(ds1, ds2)
+        self.assertNotEqual(ds2, ds1)
         
-        ds2 = Dataset(None, ccdid=ccdid, visitid=visitid)
-        self.assertNotEquals(ds1, ds2)
-        self.assertNotEquals(ds2, ds1)
-        ds1 = Dataset(None, ccdid=ccdid, visitid=visitid)
-        self.assertEquals(ds1, ds2)
-        self.assertEquals(ds2, ds1)
+        ds2 = Dataset(None, ccdid=CCDID, visitid=VISITID)
+        self.assertNotEqual(ds1, ds2)
+        self.assertNotEqual(ds2, ds1)
+        ds1 = Dataset(None, ccdid=CCDID, visitid=VISITID)
+        self.assertEqual(ds1, ds2)
+        self.assertEqual(ds2, ds1)
         
 
 
@@ -27,176 +27,191 @@ Tests of the IDFilter classes
 """
 from __future__ import with_statement
 
-import pdb                              # we may want to say pdb.set_trace()
-import os
-import sys
+import pickle
 import unittest
-import time
 
 import lsst.ctrl.sched.joboffice.id as id
 from lsst.pex.policy import Policy
 
-class AbstractIDFilterTestCase(unittest.TestCase):
+# (input, expected) pairs for IntegerIDFilter.recognize()
+NOCONSTRAINT_CASES = ((2, 2), (-1, -1), ("-1", -1), ("5,0", None), (3, 3),
+                      (float("inf"), None))
+MIN_CASES = ((2, None), (-1, None), ("-1", None), ("50", 50), (3, 3))
+LIM_CASES = ((2, 2), (-1, -1), ("-1", -1), ("50", None))
+MIN0_CASES = ((-1, None), ("-1", None), (0, 0), ("0", 0), (5, 5))
+LIM0_CASES = ((0, None), ("0", None), (-1, -1), ("-1", -1), (5, None))
+RANGE_CASES = ((-1, None), ("-1", None), ("50", None), (3, 3), (0, 0),
+               (15, 15), (16, None))
+VALUES2_CASES = ((-1, None), ("-1", None), ("50", None), (3, 3), (0, None),
+                 (15, None), (6, 6), (-8, -8), (16, None))
+VALUES3_CASES = ((-1, None), ("-1", None), ("50", None), (3, 3), (0, None),
+                 (15, None))
+VALUES4_CASES = RANGE_CASES + ((20, 20), (23, None), (25, 25))
+
+RANGE16 = tuple(range(16))
+STRING_VALUES1 = ("3", "0", "15", "14", "4", "5")
+STRING_VALUES2 = ("r", "6,0", "-8")
+STRING_ALLOWED = ("the", "quick", "brown")
+
+_filters = {}
+def _mkidf(min=None, lim=None, values=None):
+    """
+    return a shared IntegerIDFilter for "visit" with the given constraints.
+    The filters are not altered by the tests, so identical constraints can
+    share an instance.
+    @param values   a tuple or a single integer (so that it can be hashed)
+    """
+    key = (min, lim, values)
+    if key not in _filters:
+        _filters[key] = id.IntegerIDFilter("visit", min, lim, values=values)
+    return _filters[key]
+
+# value sets that the filter constructors must reject
+BAD_INT_VALUES = (["4", "9", "7"], [3, "6", -8], "6")
+BAD_STRING_VALUES = (range(4), [3, "6", -8], 6)
 
-    def setUp(self):
-        pass
-    def tearDown(self):
-        pass
+class AbstractIDFilterTestCase(unittest.TestCase):
 
     def testNoCtor(self):
-        self.assertRaises(RuntimeError, id.IDFilter, "Goofy")
+        with self.assertRaises(RuntimeError):
+            id.IDFilter("Goofy")
 
     def testNoRecognizeImpl(self):
         idf = id.IDFilter("Goofy", fromSubclass=True)
-        self.assertRaises(RuntimeError, idf.recognize, 1)
+        with self.assertRaises(RuntimeError):
+            idf.recognize(1)
 
 class IntegerIDFilterTestCase(unittest.TestCase):
 
-    def setUp(self):
-        pass
-    def tearDown(self):
-        pass
+    @classmethod
+    def setUpClass(cls):
+        cls._pTemplate = Policy()
+        cls._pTemplate.set("name", "visit")
+
+    def _probe(self, idf, cases):
+        for inp, expected in cases:
+            self.assertEqual(idf.recognize(inp), expected,
+                              "recognize(%r) != %r" % (inp, expected))
 
     def testNoConstraints(self, idf=None):
         if not idf:
-            idf = id.IntegerIDFilter("visit")
-        self.assert_(idf.isUnconstrained())
-        self.assertEquals(idf.name, "visit")
-        self.assertEquals(idf.outname, "visit")
-
-        self.assertEquals(idf.recognize(2), 2)
-        self.assertEquals(idf.recognize(-1), -1)
-        self.assertEquals(idf.recognize("-1"), -1)
-        self.assert_(idf.recognize("5,0") is None)
-        self.assertEquals(idf.recognize(3), 3)
-        
+            idf = _mkidf()
+        self.assertTrue(idf.isUnconstrained())
+        self.assertEqual(idf.name, "visit")
+        self.assertEqual(idf.outname, "visit")
+
+        self._probe(idf, NOCONSTRAINT_CASES)
 
     def testMin(self, idf=None):
         if not idf:
-            idf = id.IntegerIDFilter("visit", 3)
-        self.assertEquals(idf.name, "visit")
-        self.assert_(not idf.isUnconstrained())
+            idf = _mkidf(3)
+        self.assertEqual(idf.name, "visit")
+        self.assertFalse(idf.isUnconstrained())
 
-        self.assert_(idf.recognize(2) is None)
-        self.assert_(idf.recognize(-1) is None)
-        self.assert_(idf.recognize("-1") is None)
-        self.assertEquals(idf.recognize("50"), 50)
-        self.assertEquals(idf.recognize(3), 3)
+        self._probe(idf, MIN_CASES)
 
     def testLim(self, idf=None):
         if not idf:
-            idf = id.IntegerIDFilter("visit", lim=3)
-        self.assertEquals(idf.name, "visit")
-        self.assert_(not idf.isUnconstrained())
+            idf = _mkidf(lim=3)
+        self.assertEqual(idf.name, "visit")
+        self.assertFalse(idf.isUnconstrained())
+
+        self._probe(idf, LIM_CASES)
 
-        self.assertEquals(idf.recognize(2), 2)
-        self.assertEquals(idf.recognize(-1), -1)
-        self.assertEquals(idf.recognize("-1"), -1)
-        self.assert_(idf.recognize("50") is None)
-        self.assert_(idf.recognize("50") is None)
+    def testZeroBounds(self):
+        # a bound of zero is a real constraint, not an absent one
+        idf = _mkidf(0)
+        self.assertFalse(idf.isUnconstrained())
+        self._probe(idf, MIN0_CASES)
+
+        idf = _mkidf(lim=0)
+        self.assertFalse(idf.isUnconstrained())
+        self._probe(idf, LIM0_CASES)
 
     def testRange(self, idf=None):
         if not idf:
-            idf = id.IntegerIDFilter("visit", 0, 16)
-        self.assertEquals(idf.name, "visit")
-        self.assert_(not idf.isUnconstrained())
-
-        self.assert_(idf.recognize(-1) is None)
-        self.assert_(idf.recognize("-1") is None)
-        self.assert_(idf.recognize("50") is None)
-        self.assertEquals(idf.recognize(3), 3)
-        self.assertEquals(idf.recognize(0), 0)
-        self.assertEquals(idf.recognize(15), 15)
-        self.assert_(idf.recognize(16) is None)
+            idf = _mkidf(0, 16)
+        self.assertEqual(idf.name, "visit")
+        self.assertFalse(idf.isUnconstrained())
+
+        self._probe(idf, RANGE_CASES)
 
     def testValues1(self, idf=None):
         if not idf:
-            idf = id.IntegerIDFilter("visit", values=range(16))
-        self.assertEquals(idf.name, "visit")
-        self.assert_(not idf.isUnconstrained())
-
-        self.assert_(idf.recognize(-1) is None)
-        self.assert_(idf.recognize("-1") is None)
-        self.assert_(idf.recognize("50") is None)
-        self.assertEquals(idf.recognize(3), 3)
-        self.assertEquals(idf.recognize(0), 0)
-        self.assertEquals(idf.recognize(15), 15)
-        self.assert_(idf.recognize(16) is None)
+            idf = _mkidf(values=RANGE16)
+        self.assertEqual(idf.name, "visit")
+        self.assertFalse(idf.isUnconstrained())
+
+        self._probe(idf, RANGE_CASES)
 
     def testValues2(self, idf=None):
         if not idf:
-            idf = id.IntegerIDFilter("visit", values=[3, 6, -8])
-        self.assertEquals(idf.name, "visit")
-        self.assert_(not idf.isUnconstrained())
-
-        self.assert_(idf.recognize(-1) is None)
-        self.assert_(idf.recognize("-1") is None)
-        self.assert_(idf.recognize("50") is None)
-        self.assertEquals(idf.recognize(3), 3)
-        self.assert_(idf.recognize(0) is None)
-        self.assert_(idf.recognize(15) is None)
-        self.assertEquals(idf.recognize(6), 6)
-        self.assertEquals(idf.recognize(-8), -8)
-        self.assert_(idf.recognize(16) is None)
+            idf = _mkidf(values=(3, 6, -8))
+        self.assertEqual(idf.name, "visit")
+        self.assertFalse(idf.isUnconstrained())
+
+        self._probe(idf, VALUES2_CASES)
 
     def testValues3(self, idf=None):
         if not idf:
-            idf = id.IntegerIDFilter("visit", values=3)
-        self.assertEquals(idf.name, "visit")
-        self.assert_(not idf.isUnconstrained())
+            idf = _mkidf(values=3)
+        self.assertEqual(idf.name, "visit")
+        self.assertFalse(idf.isUnconstrained())
 
-        self.assert_(idf.recognize(-1) is None)
-        self.assert_(idf.recognize("-1") is None)
-        self.assert_(idf.recognize("50") is None)
-        self.assertEquals(idf.recognize(3), 3)
-        self.assert_(idf.recognize(0) is None)
-        self.assert_(idf.recognize(15) is None)
+        self._probe(idf, VALUES3_CASES)
 
     def testValues4(self, idf=None):
         if not idf:
-            idf = id.IntegerIDFilter("visit", 0, 16, values=[20,25])
-        self.assertEquals(idf.name, "visit")
-        self.assert_(not idf.isUnconstrained())
-
-        self.assert_(idf.recognize(-1) is None)
-        self.assert_(idf.recognize("-1") is None)
-        self.assert_(idf.recognize("50") is None)
-        self.assertEquals(idf.recognize(3), 3)
-        self.assertEquals(idf.recognize(0), 0)
-        self.assertEquals(idf.recognize(15), 15)
-        self.assert_(idf.recognize(16) is None)
-        self.assertEquals(idf.recognize(20), 20)
-        self.assert_(idf.recognize(23) is None)
-        self.assertEquals(idf.recognize(25), 25)
+            idf = _mkidf(0, 16, values=(20, 25))
+        self.assertEqual(idf.name, "visit")
+        self.assertFalse(idf.isUnconstrained())
+
+        self._probe(idf, VALUES4_CASES)
 
     def testAllowed(self):
-        idf = id.IntegerIDFilter("visit", 0, 16, values=[20,25])
-        self.assert_(idf.hasStaticValueSet())
+        idf = _mkidf(0, 16, values=(20, 25))
+        self.assertTrue(idf.hasStaticValueSet())
 
         vals = idf.allowedValues()
-        self.assertEquals(len(vals), 18)
-        self.assertEquals(vals[0], 0)
-        self.assertEquals(vals[-3], 15)
-        self.assertEquals(vals[-2], 20)
-        self.assertEquals(vals[-1], 25)
+        self.assertEqual(len(vals), 18)
+        self.assertEqual(vals[0], 0)
+        self.assertEqual(vals[-3], 15)
+        self.assertEqual(vals[-2], 20)
+        self.assertEqual(vals[-1], 25)
 
-        idf = id.IntegerIDFilter("visit", 0)
-        self.assert_(not idf.hasStaticValueSet())
-        self.assertRaises(RuntimeError, idf.allowedValues)
+        idf = _mkidf(0)
+        self.assertFalse(idf.hasStaticValueSet())
+        with self.assertRaises(RuntimeError):
+            idf.allowedValues()
 
     def testBadValues(self):
-        self.assertRaises(ValueError, id.IntegerIDFilter, "visit", values="4 9 7".split())
-        self.assertRaises(ValueError, id.IntegerIDFilter, "visit", values=[3, "6", -8])
-        self.assertRaises(ValueError, id.IntegerIDFilter, "visit", values="6")
+        for vals in BAD_INT_VALUES:
+            with self.assertRaises(ValueError):
+                id.IntegerIDFilter("visit", values=vals)
+
+    def testPickle(self):
+        idf = pickle.loads(pickle.dumps(_mkidf(0, 16, values=(20, 25))))
+        self._probe(idf, VALUES4_CASES)
+
+    def testSubclassRecognize(self):
+        class EvenIDFilter(id.IntegerIDFilter):
+            def recognize(self, ident):
+                ident = super(EvenIDFilter, self).recognize(ident)
+                if ident is not None and ident % 2 == 0:
+                    return ident
+                return None
+
+        idf = EvenIDFilter("visit", 0, 16)
+        self.assertEqual(idf.recognize(4), 4)
+        self.assertIsNone(idf.recognize(5))
 
     def testFromPolicy(self):
-        p = Policy()
-        p.set("name", "visit")
+        p = Policy(self._pTemplate, True)
         idf = id.IntegerIDFilter.fromPolicy(p)
         self.testNoConstraints(idf)
 
         idf = id.IDFilter.fromPolicy(p)
-        self.assert_(not isinstance(idf, id.IntegerIDFilter))
+        self.assertFalse(isinstance(idf, id.IntegerIDFilter))
         p.set("className", "Integer")
         idf = id.IDFilter.fromPolicy(p)
         self.testNoConstraints(idf)
@@ -205,7 +220,8 @@ class IntegerIDFilterTestCase(unittest.TestCase):
         self.testNoConstraints(idf)
 
         p.set("className", "lsst.ctrl.sched.joboffice.id.IntegerIDFilter")
-        self.assertRaises(RuntimeError, id.IDFilter.fromPolicy, p)
+        with self.assertRaises(RuntimeError):
+            id.IDFilter.fromPolicy(p)
         p.set("className", "Integer")
         
         p.set("min", 3)
@@ -222,114 +238,115 @@ class IntegerIDFilterTestCase(unittest.TestCase):
 
 class StringIDFilterTestCase(unittest.TestCase):
 
-    def setUp(self):
-        pass
-    def tearDown(self):
-        pass
+    @classmethod
+    def setUpClass(cls):
+        cls._pTemplate = Policy()
+        cls._pTemplate.set("name", "visit")
 
     def testNoConstraints(self, idf=None):
         if not idf:
             idf = id.StringIDFilter("visit")
-        self.assert_(idf.isUnconstrained())
-        self.assertEquals(idf.name, "visit")
-        self.assertEquals(idf.outname, "visit")
-
-        self.assert_(idf.recognize(2), "2")
-        self.assert_(idf.recognize(-1), "-1")
-        self.assert_(idf.recognize("-1"), "-1")
-        self.assert_(idf.recognize("50"), "50")
-        self.assert_(idf.recognize(3), "3")
+        self.assertTrue(idf.isUnconstrained())
+        self.assertEqual(idf.name, "visit")
+        self.assertEqual(idf.outname, "visit")
+
+        self.assertEqual(idf.recognize(2), "2")
+        self.assertEqual(idf.recognize(-1), "-1")
+        self.assertEqual(idf.recognize("-1"), "-1")
+        self.assertEqual(idf.recognize("50"), "50")
+        self.assertEqual(idf.recognize(3), "3")
         
     def testValues1(self, idf=None):
         if not idf:
-            idf = id.StringIDFilter("visit", values="3 0 15 14 4 5".split())
-        self.assertEquals(idf.name, "visit")
+            idf = id.StringIDFilter("visit", values=STRING_VALUES1)
+        self.assertEqual(idf.name, "visit")
 
-        self.assert_(idf.recognize(-1) is None)
-        self.assert_(idf.recognize("-1") is None)
-        self.assert_(idf.recognize("50") is None)
-        self.assertEquals(idf.recognize(3), "3")
-        self.assertEquals(idf.recognize("0"), "0")
-        self.assertEquals(idf.recognize("15"), "15")
-        self.assert_(idf.recognize("16") is None)
+        self.assertIsNone(idf.recognize(-1))
+        self.assertIsNone(idf.recognize("-1"))
+        self.assertIsNone(idf.recognize("50"))
+        self.assertEqual(idf.recognize(3), "3")
+        self.assertEqual(idf.recognize("0"), "0")
+        self.assertEqual(idf.recognize("15"), "15")
+        self.assertIsNone(idf.recognize("16"))
 
     def testValues2(self, idf=None):
         if not idf:
-            idf = id.StringIDFilter("visit", "r 6,0 -8".split())
-        self.assertEquals(idf.name, "visit")
-
-        self.assert_(not idf.isUnconstrained())
-        self.assert_(idf.recognize(-1) is None)
-        self.assert_(idf.recognize("-1") is None)
-        self.assert_(idf.recognize("50") is None)
-        self.assertEquals(idf.recognize("r"), "r")
-        self.assert_(idf.recognize("0") is None)
-        self.assert_(idf.recognize("zub") is None)
-        self.assertEquals(idf.recognize("6,0"), "6,0")
-        self.assertEquals(idf.recognize("-8"), "-8")
-        self.assert_(idf.recognize("16") is None)
+            idf = id.StringIDFilter("visit", STRING_VALUES2)
+        self.assertEqual(idf.name, "visit")
+
+        self.assertFalse(idf.isUnconstrained())
+        self.assertIsNone(idf.recognize(-1))
+        self.assertIsNone(idf.recognize("-1"))
+        self.assertIsNone(idf.recognize("50"))
+        self.assertEqual(idf.recognize("r"), "r")
+        self.assertIsNone(idf.recognize("0"))
+        self.assertIsNone(idf.recognize("zub"))
+        self.assertEqual(idf.recognize("6,0"), "6,0")
+        self.assertEqual(idf.recognize("-8"), "-8")
+        self.assertIsNone(idf.recognize("16"))
 
     def testValues3(self, idf=None):
         if not idf:
             idf = id.StringIDFilter("visit", values="r")
-        self.assertEquals(idf.name, "visit")
+        self.assertEqual(idf.name, "visit")
 
-        self.assert_(not idf.isUnconstrained())
-        self.assert_(idf.recognize(-1) is None)
-        self.assert_(idf.recognize("") is None)
-        self.assert_(idf.recognize("b") is None)
-        self.assertEquals(idf.recognize("r"), "r")
-        self.assert_(idf.recognize(0) is None)
-        self.assert_(idf.recognize(15) is None)
+        self.assertFalse(idf.isUnconstrained())
+        self.assertIsNone(idf.recognize(-1))
+        self.assertIsNone(idf.recognize(""))
+        self.assertIsNone(idf.recognize("b"))
+        self.assertEqual(idf.recognize("r"), "r")
+        self.assertIsNone(idf.recognize(0))
+        self.assertIsNone(idf.recognize(15))
 
     def testAllowed(self):
-        idf = id.StringIDFilter("visit", "the quick brown".split())
-        self.assert_(idf.hasStaticValueSet())
-        self.assert_(not idf.isUnconstrained())
+        idf = id.StringIDFilter("visit", STRING_ALLOWED)
+        self.assertTrue(idf.hasStaticValueSet())
+        self.assertFalse(idf.isUnconstrained())
 
         vals = idf.allowedValues()
-        self.assertEquals(len(vals), 3)
-        self.assertEquals(vals[0], "brown")
-        self.assertEquals(vals[1], "quick")
-        self.assertEquals(vals[2], "the")
+        self.assertEqual(len(vals), 3)
+        self.assertEqual(vals[0], "brown")
+        self.assertEqual(vals[1], "quick")
+        self.assertEqual(vals[2], "the")
 
     def testBadValues(self):
-        self.assertRaises(ValueError, id.StringIDFilter, "visit", values=range(4))
-        self.assertRaises(ValueError, id.StringIDFilter, "visit", values=[3, "6", -8])
-        self.assertRaises(ValueError, id.StringIDFilter, "visit", values=6)
+        for vals in BAD_STRING_VALUES:
+            with self.assertRaises(ValueError):
+                id.StringIDFilter("visit", values=vals)
 
     def testFromPolicy(self):
-        p = Policy()
-        p.set("name", "visit")
-        idf = id.IntegerIDFilter.fromPolicy(p)
+        p = Policy(self._pTemplate, True)
+        idf = id.StringIDFilter.fromPolicy(p)
         self.testNoConstraints(idf)
 
         idf = id.IDFilter.fromPolicy(p)
-        self.assert_(isinstance(idf, id.StringIDFilter))
+        self.assertTrue(isinstance(idf, id.StringIDFilter))
         p.set("className", "String")
         idf = id.IDFilter.fromPolicy(p)
-        self.assert_(isinstance(idf, id.StringIDFilter))
+        self.assertTrue(isinstance(idf, id.StringIDFilter))
         self.testNoConstraints(idf)
         p.set("className", "StringIDFilter")
         idf = id.IDFilter.fromPolicy(p)
-        self.assert_(isinstance(idf, id.StringIDFilter))
+        self.assertTrue(isinstance(idf, id.StringIDFilter))
         self.testNoConstraints(idf)
 
         p.set("className", "lsst.ctrl.sched.joboffice.id.StringIDFilter")
-        self.assertRaises(RuntimeError, id.IDFilter.fromPolicy, p)
+        with self.assertRaises(RuntimeError):
+            id.IDFilter.fromPolicy(p)
         p.set("className", "String")
         
         p.set("value", "-8")
         p.add("value", "r")
         p.add("value", "6,0")
         idf = id.IDFilter.fromPolicy(p)
-        self.assert_(isinstance(idf, id.StringIDFilter))
+        self.assertTrue(isinstance(idf, id.StringIDFilter))
         self.testValues2(idf)
 
 
 
 
-__all__ = "AbstractIDFilterTestCase IntegerIDFilterTestCase StringIDFilterTestCase".split()
+__all__ = ("AbstractIDFilterTestCase", "IntegerIDFilterTestCase",
+           "StringIDFilterTestCase")
 
 if __name__ == "__main__":
     unittest.main()
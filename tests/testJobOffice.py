@@ -32,18 +32,18 @@ import os
 import sys
 import unittest
 import time
-import copy
+import shutil
+import tempfile
 
 from lsst.ctrl.sched.joboffice.jobOffice import JobOffice, _BaseJobOffice, DataTriggeredJobOffice, unserializePolicy, serializePolicy
 from lsst.ctrl.sched.blackboard.item import JobItem, DataProductItem
 from lsst.ctrl.sched import Dataset
+from lsst.ctrl.sched.utils import brokerReachable
 from lsst.pex.policy import Policy, DefaultPolicyFile
 from lsst.daf.base import PropertySet
 from lsst.ctrl.events import StatusEvent, CommandEvent, EventTransmitter, EventSystem
 
-testdir = os.path.join(os.environ["CTRL_SCHED_DIR"], "tests")
 exampledir = os.path.join(os.environ["CTRL_SCHED_DIR"], "examples")
-bbdir = os.path.join(testdir, "testbb")
 policyFile = DefaultPolicyFile("ctrl_sched", "ccdassembly-joboffice.paf",
                                "examples")
 postisrdata = """#<?cfg paf policy ?>
@@ -59,55 +59,104 @@ ampid: 5
 brokerhost = "lsst8.ncsa.uiuc.edu"
 originatorId = EventSystem.getDefaultEventSystem().createOriginatorId()
 
+def cloneDataset(ds, **ids):
+    """
+    return a copy of a Dataset.  Only the ids dictionary is mutable, so this
+    is much cheaper than copy.deepcopy().
+    @param ds     the Dataset to copy
+    @param **ids  identifier values to override in the copy
+    """
+    out = Dataset(ds.type, ds.path, ds.valid, dict(ds.ids))
+    out.ids.update(ids)
+    return out
+
 class AbstractJobOfficeTestCase(unittest.TestCase):
 
     def setUp(self):
-        pass
+        self.testdir = tempfile.mkdtemp(prefix="ctrlsched_")
+        self.bbdir = os.path.join(self.testdir, "testbb")
     def tearDown(self):
-        if os.path.exists(bbdir):
-            os.system("rm -rf %s" % bbdir)
+        shutil.rmtree(self.testdir, ignore_errors=True)
         self.sched = None
 
     def testNoCtor(self):
-        self.assertRaises(RuntimeError, JobOffice, bbdir)
-        self.assertRaises(RuntimeError, _BaseJobOffice, bbdir)
+        self.assertRaises(RuntimeError, JobOffice, self.bbdir)
+        self.assertRaises(RuntimeError, _BaseJobOffice, self.bbdir)
 
     def testNoRunImpl(self):
-        jo = JobOffice(bbdir, fromSubclass=True)
+        jo = JobOffice(self.bbdir, fromSubclass=True)
         self.assertRaises(RuntimeError, jo.managePipelines)
 
 
 class DataTriggeredJobOfficeTestCase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.policy = Policy.createPolicy(policyFile)
+        cls.postisrPolicy = unserializePolicy(postisrdata)
+        cls.postisr = Dataset.fromPolicy(cls.postisrPolicy)
+
+        # the serialized PostISR datasets, indexed by ampid
+        cls.postisrStrs = [serializePolicy(cloneDataset(cls.postisr,
+                                                        ampid=i).toPolicy())
+                           for i in xrange(16)]
+
+        # publishers for the data and pipeline topics, shared by the tests
+        cls.trxData = EventTransmitter(brokerhost, "PostISRAvailable")
+        cls.trxPipe = EventTransmitter(brokerhost, "CcdAssemblyJob")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.trxData = None
+        cls.trxPipe = None
+
     def setUp(self):
-        policy = Policy.createPolicy(policyFile)
+        # the job office merges defaults into its policy, so give it a copy
+        policy = Policy(self.policy, True)
+        self.testdir = tempfile.mkdtemp(prefix="ctrlsched_")
         # pdb.set_trace()
-        self.joboffice = DataTriggeredJobOffice(testdir, policy=policy, log=None, runId="testing", brokerHost=brokerhost)
+        self.joboffice = DataTriggeredJobOffice(self.testdir, policy=policy, log=None, runId="testing", brokerHost=brokerhost)
         self.joboffice.log.setThreshold(self.joboffice.log.WARN)
-        self.jodir = os.path.join(testdir, "ccdassembly")
+        self.jodir = os.path.join(self.testdir, "ccdassembly")
         
     def tearDown(self):
         self.joboffice = None
-        if os.path.exists(self.jodir):
-            os.system("rm -rf %s" % self.jodir)
+        shutil.rmtree(self.testdir, ignore_errors=True)
+
+    def waitForQueues(self, timeout=2.0, **lengths):
+        """
+        wait until the named blackboard queues have the given lengths,
+        returning as soon as they do or after timeout seconds.
+        @return bool   True if the queues reached the given lengths
+        """
+        deadline = time.time() + timeout
+        while True:
+            qlen = self.joboffice.bb.queueLengths()
+            if all([getattr(qlen, name) == n for name, n in lengths.items()]):
+                return True
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.05)
 
     def testCtor(self):
         self.assert_(os.path.exists(self.jodir), "Blackboard dir not created")
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.jobsPossible.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsAvailable.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsDone.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.dataAvailable.length(),0)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.jobsPossible, 0)
+        self.assertEquals(qlen.jobsAvailable, 0)
+        self.assertEquals(qlen.jobsDone, 0)
+        self.assertEquals(qlen.jobsInProgress, 0)
+        self.assertEquals(qlen.dataAvailable, 0)
 
     def testDatasetFromProperty(self):
-        ds = self.joboffice.datasetFromProperty(postisrdata)
-        self.assertEquals(ds.type, "PostISR")
-        self.assertEquals(ds.ids["visitid"], 44291)
-        self.assertEquals(ds.ids["ccdid"], 3)
-        self.assertEquals(ds.ids["raftid"], 33)
-        self.assertEquals(ds.ids["snapid"], 0)
-        self.assertEquals(ds.ids["ampid"], 5)
-        return ds
+        # accepts both the PAF string and the parsed Policy
+        for data in (postisrdata, self.postisrPolicy):
+            ds = self.joboffice.datasetFromProperty(data)
+            self.assertEquals(ds.type, "PostISR")
+            self.assertEquals(ds.ids["visitid"], 44291)
+            self.assertEquals(ds.ids["ccdid"], 3)
+            self.assertEquals(ds.ids["raftid"], 33)
+            self.assertEquals(ds.ids["snapid"], 0)
+            self.assertEquals(ds.ids["ampid"], 5)
 
     def testToPipelineQueueItem(self):
         pipelineName = "ccdassembly"
@@ -123,13 +172,10 @@ class DataTriggeredJobOfficeTestCase(unittest.TestCase):
         self.assertEquals(item.getRunId(), "testing")
 
     def testMakeJobCommandEvent(self):
-        ds = self.testDatasetFromProperty()
-        dss = [ds]
-        for i in xrange(1, 5):
-            ds = copy.deepcopy(ds)
-            ds.ids["ampid"] += 1
-            dss.append(ds)
-        ods = Dataset("PostISR-CCD", visit=ds.ids["visitid"], ccd=ds.ids["ccdid"])
+        base = self.postisr
+        dss = [cloneDataset(base, ampid=base.ids["ampid"]+i) for i in xrange(5)]
+        ods = Dataset("PostISR-CCD", visit=base.ids["visitid"],
+                      ccd=base.ids["ccdid"])
 
         job = JobItem.createItem(ods, "ccdassembly", dss, ods)
         jev = self.joboffice.makeJobCommandEvent(job, 9993252, "testing")
@@ -140,33 +186,25 @@ class DataTriggeredJobOfficeTestCase(unittest.TestCase):
         self.assert_(jev.getPropertySet().exists("inputs"))
         self.assert_(jev.getPropertySet().exists("outputs"))
 
-        dodss = jev.getPropertySet().getArrayString("inputs")
+        dodss = [Dataset.fromPolicy(unserializePolicy(ds)) for ds in
+                 jev.getPropertySet().getArrayString("inputs")]
         self.assertEquals(len(dodss), 5)
-        i = 5
-        for ds in dodss:
-            ds = Dataset.fromPolicy(unserializePolicy(ds))
-            self.assertEquals(ds.type, "PostISR")
-            self.assertEquals(ds.ids["ampid"], i)
-            self.assertEquals(ds.ids["visitid"], 44291)
-            self.assertEquals(ds.ids["ccdid"], 3)
-            self.assertEquals(ds.ids["raftid"], 33)
-            self.assertEquals(ds.ids["snapid"], 0)
-            i += 1
+        self.assertEquals([ds.type for ds in dodss], 5 * ["PostISR"])
+        self.assertEquals([ds.ids for ds in dodss],
+                          [{"visitid": 44291, "ccdid": 3, "raftid": 33,
+                            "snapid": 0, "ampid": i} for i in xrange(5, 10)])
 
     def testProcessDataEvent(self):
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.dataAvailable.length(), 0)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.dataAvailable, 0)
 
         ps = PropertySet()
         ps.set("pipelineName", "PostISR")
         ps.set("STATUS", "available")
 
-        ds = self.testDatasetFromProperty()
-        ps.add("dataset", serializePolicy(ds.toPolicy()))
-        for i in xrange(1,4):
-            ds = copy.deepcopy(ds)
-            ds.ids["ampid"] += 1
-            ps.add("dataset", serializePolicy(ds.toPolicy()))
+        ampid = self.postisr.ids["ampid"]
+        for dsstr in self.postisrStrs[ampid:ampid+4]:
+            ps.add("dataset", dsstr)
 
         devent = StatusEvent("testing", originatorId, ps)
 
@@ -180,27 +218,39 @@ class DataTriggeredJobOfficeTestCase(unittest.TestCase):
           self.assertEquals(job.getName(), "Job-1")
           self.assertEquals(job.triggerHandler.getNeededDatasetCount(), 12)
     
-    def testProcessDataEvents(self):
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.dataAvailable.length(), 0)
+    def testProcessDataEventBadDataset(self):
+        ps = PropertySet()
+        ps.set("pipelineName", "PostISR")
+        ps.set("STATUS", "available")
+
+        # the third of four datasets cannot be decoded
+        ps.add("dataset", self.postisrStrs[0])
+        ps.add("dataset", self.postisrStrs[1])
+        ps.add("dataset", "#<?cfg paf policy ?>\ntype: PostISR\nids: {\n")
+        ps.add("dataset", self.postisrStrs[3])
+        devent = StatusEvent("testing", originatorId, ps)
 
-        trx = EventTransmitter(brokerhost, "PostISRAvailable")
+        self.assertRaises(RuntimeError,
+                          self.joboffice.processDataEvent, devent)
+
+        # the datasets ahead of the bad one were still scheduled
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.dataAvailable, 2)
+        self.assertEquals(qlen.jobsPossible, 1)
+
+    def testProcessDataEvents(self):
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.dataAvailable, 0)
 
         ps = PropertySet()
         ps.set("pipelineName", "PostISR")
         ps.set("STATUS", "available")
 
-        ds = self.testDatasetFromProperty()
-        ds.ids["ampid"] = 0;
-        ps.set("dataset", serializePolicy(ds.toPolicy()))
-        for i in xrange(15):
-            ps.set("dataset", serializePolicy(ds.toPolicy()))
+        for dsstr in self.postisrStrs[:15]:
+            ps.set("dataset", dsstr)
             devent = StatusEvent("testing", originatorId, ps)
 
-            trx.publishEvent(devent);
-
-            ds = copy.deepcopy(ds)
-            ds.ids["ampid"] += 1
+            self.trxData.publishEvent(devent)
 
         # Wait for events
         time.sleep(2.0)
@@ -215,9 +265,9 @@ class DataTriggeredJobOfficeTestCase(unittest.TestCase):
           self.assertEquals(job.getName(), "Job-1")
           self.assertEquals(job.triggerHandler.getNeededDatasetCount(), 1)
 
-        ps.set("dataset", serializePolicy(ds.toPolicy()))
+        ps.set("dataset", self.postisrStrs[15])
         devent = StatusEvent("testing", originatorId, ps)
-        trx.publishEvent(devent);
+        self.trxData.publishEvent(devent)
         time.sleep(2.0)
         self.joboffice.processDataEvents()
         
@@ -241,45 +291,44 @@ class DataTriggeredJobOfficeTestCase(unittest.TestCase):
           self.assertEquals(job.getName(), "Job-1")
 
     def testReceiveReadyPipelines(self):
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.pipelinesReady.length(),0)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.pipelinesReady, 0)
 
         ps = PropertySet()
         ps.set("pipelineName", "PostISR")
         ps.set("STATUS", "job:ready")
         pevent = StatusEvent("testing", originatorId, ps)
         
-        trx = EventTransmitter(brokerhost, "CcdAssemblyJob")
-        trx.publishEvent(pevent)
+        self.trxPipe.publishEvent(pevent)
         time.sleep(2.0)
 
         self.joboffice.receiveReadyPipelines()
 
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.pipelinesReady.length(),1)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.pipelinesReady, 1)
         
     def testAllocateJobs(self):
         # pdb.set_trace()
         self.testReceiveReadyPipelines()
         self.testFindAvailableJobs()
 
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.pipelinesReady.length(),1)
-          self.assertEquals(self.joboffice.bb.queues.jobsAvailable.length(),1)
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),0)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.pipelinesReady, 1)
+        self.assertEquals(qlen.jobsAvailable, 1)
+        self.assertEquals(qlen.jobsInProgress, 0)
 
         # pdb.set_trace()
         self.joboffice.allocateJobs()
 
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.pipelinesReady.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsAvailable.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),1)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.pipelinesReady, 0)
+        self.assertEquals(qlen.jobsAvailable, 0)
+        self.assertEquals(qlen.jobsInProgress, 1)
 
     def testProcessJobDoneEvent(self):
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsDone.length(),0)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.jobsInProgress, 0)
+        self.assertEquals(qlen.jobsDone, 0)
 
         ps = PropertySet()
         ps.set("pipelineName", "PostISR")
@@ -291,106 +340,90 @@ class DataTriggeredJobOfficeTestCase(unittest.TestCase):
 
         self.testAllocateJobs()
         
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),1)
-          self.assertEquals(self.joboffice.bb.queues.jobsDone.length(),0)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.jobsInProgress, 1)
+        self.assertEquals(qlen.jobsDone, 0)
 
         # pdb.set_trace()
         self.assert_(self.joboffice.processJobDoneEvent(pevent))
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsDone.length(),1)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.jobsInProgress, 0)
+        self.assertEquals(qlen.jobsDone, 1)
         
     def testProcessJobDoneEvents(self):
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsDone.length(),0)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.jobsInProgress, 0)
+        self.assertEquals(qlen.jobsDone, 0)
 
         self.testAllocateJobs()
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),1)
-          self.assertEquals(self.joboffice.bb.queues.jobsDone.length(),0)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.jobsInProgress, 1)
+        self.assertEquals(qlen.jobsDone, 0)
 
         ps = PropertySet()
         ps.set("pipelineName", "PostISR")
         ps.set("STATUS", "job:done")
         ps.set("success", True)
         pevent = StatusEvent("testing", originatorId, ps)
-        trx = EventTransmitter(brokerhost, "CcdAssemblyJob")
-        trx.publishEvent(pevent)
+        self.trxPipe.publishEvent(pevent)
         time.sleep(2.0)
 
         self.joboffice.processDoneJobs()
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsDone.length(),1)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.jobsInProgress, 0)
+        self.assertEquals(qlen.jobsDone, 1)
 
 
     def testRun(self):
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsDone.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsAvailable.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.dataAvailable.length(),0)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.jobsInProgress, 0)
+        self.assertEquals(qlen.jobsDone, 0)
+        self.assertEquals(qlen.jobsAvailable, 0)
+        self.assertEquals(qlen.dataAvailable, 0)
 
-        trxpipe = EventTransmitter(brokerhost, "CcdAssemblyJob")
         ps = PropertySet()
         ps.set("pipelineName", "PostISR")
         ps.set("STATUS", "job:ready")
         pevent = StatusEvent("testing", originatorId, ps)
-        trxpipe.publishEvent(pevent)
-        time.sleep(2.0)
-
-        self.joboffice.managePipelines(1)
-        
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.pipelinesReady.length(),1)
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),0)
-
-        trxdata = EventTransmitter(brokerhost, "PostISRAvailable")
+        self.trxPipe.publishEvent(pevent)
 
         ps = PropertySet()
         ps.set("pipelineName", "PostISR")
         ps.set("STATUS", "available")
 
-        ds = self.testDatasetFromProperty()
-        ds.ids["ampid"] = 0;
-        ps.set("dataset", serializePolicy(ds.toPolicy()))
-        # pdb.set_trace()
-        for i in xrange(16):
-            ps.set("dataset", serializePolicy(ds.toPolicy()))
-            devent = StatusEvent("testing", originatorId, ps)
-
-            trxdata.publishEvent(devent);
-
-            ds = copy.deepcopy(ds)
-            ds.ids["ampid"] += 1
+        # announce all 16 datasets in a single event
+        for dsstr in self.postisrStrs:
+            ps.add("dataset", dsstr)
+        devent = StatusEvent("testing", originatorId, ps)
+        self.trxData.publishEvent(devent)
 
         time.sleep(2.0)
 
+        # one iteration receives the data, builds the job, and hands it
+        # to the ready pipeline
         self.joboffice.managePipelines(1)
         
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),1)
-          self.assertEquals(self.joboffice.bb.queues.jobsDone.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsAvailable.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.dataAvailable.length(),16)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.jobsInProgress, 1)
+        self.assertEquals(qlen.jobsDone, 0)
+        self.assertEquals(qlen.jobsAvailable, 0)
+        self.assertEquals(qlen.dataAvailable, 16)
 
         ps = PropertySet()
         ps.set("pipelineName", "PostISR")
         ps.set("STATUS", "job:done")
         ps.set("success", True)
         jevent = StatusEvent("testing", originatorId, ps)
-        trxpipe.publishEvent(jevent)
+        self.trxPipe.publishEvent(jevent)
         time.sleep(2.0)
 
         self.joboffice.managePipelines(1)
         
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsDone.length(),1)
-          self.assertEquals(self.joboffice.bb.queues.jobsAvailable.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.dataAvailable.length(),16)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.jobsInProgress, 0)
+        self.assertEquals(qlen.jobsDone, 1)
+        self.assertEquals(qlen.jobsAvailable, 0)
+        self.assertEquals(qlen.dataAvailable, 16)
 
     def testRunInThread(self):
       self.assert_(not self.joboffice.isAlive())
@@ -398,63 +431,53 @@ class DataTriggeredJobOfficeTestCase(unittest.TestCase):
       self.assert_(self.joboffice.isAlive())
 
       try:
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsDone.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsAvailable.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.dataAvailable.length(),0)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.jobsInProgress, 0)
+        self.assertEquals(qlen.jobsDone, 0)
+        self.assertEquals(qlen.jobsAvailable, 0)
+        self.assertEquals(qlen.dataAvailable, 0)
 
-        trxpipe = EventTransmitter(brokerhost, "CcdAssemblyJob")
         ps = PropertySet()
         ps.set("pipelineName", "PostISR")
         ps.set("STATUS", "job:ready")
         pevent = StatusEvent("testing", originatorId, ps)
-        trxpipe.publishEvent(pevent)
-        time.sleep(2.0)
-
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.pipelinesReady.length(),1)
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),0)
+        self.trxPipe.publishEvent(pevent)
+        self.waitForQueues(pipelinesReady=1)
 
-        trxdata = EventTransmitter(brokerhost, "PostISRAvailable")
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.pipelinesReady, 1)
+        self.assertEquals(qlen.jobsInProgress, 0)
 
         ps = PropertySet()
         ps.set("pipelineName", "PostISR")
         ps.set("STATUS", "available")
 
-        ds = self.testDatasetFromProperty()
-        ds.ids["ampid"] = 0;
-        ps.set("dataset", serializePolicy(ds.toPolicy()))
-        # pdb.set_trace()
-        for i in xrange(16):
-            ps.set("dataset", serializePolicy(ds.toPolicy()))
-            devent = StatusEvent("testing", originatorId, ps)
-
-            trxdata.publishEvent(devent);
-
-            ds = copy.deepcopy(ds)
-            ds.ids["ampid"] += 1
-        time.sleep(2.0)
+        # announce all 16 datasets in a single event
+        for dsstr in self.postisrStrs:
+            ps.add("dataset", dsstr)
+        devent = StatusEvent("testing", originatorId, ps)
+        self.trxData.publishEvent(devent)
+        self.waitForQueues(jobsInProgress=1)
 
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),1)
-          self.assertEquals(self.joboffice.bb.queues.jobsDone.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsAvailable.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.dataAvailable.length(),16)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.jobsInProgress, 1)
+        self.assertEquals(qlen.jobsDone, 0)
+        self.assertEquals(qlen.jobsAvailable, 0)
+        self.assertEquals(qlen.dataAvailable, 16)
 
         ps = PropertySet()
         ps.set("pipelineName", "PostISR")
         ps.set("STATUS", "job:done")
         ps.set("success", True)
         jevent = StatusEvent("testing", originatorId, ps)
-        trxpipe.publishEvent(jevent)
-        time.sleep(2.0)
+        self.trxPipe.publishEvent(jevent)
+        self.waitForQueues(jobsDone=1)
 
-        with self.joboffice.bb.queues:
-          self.assertEquals(self.joboffice.bb.queues.jobsInProgress.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.jobsDone.length(),1)
-          self.assertEquals(self.joboffice.bb.queues.jobsAvailable.length(),0)
-          self.assertEquals(self.joboffice.bb.queues.dataAvailable.length(),16)
+        qlen = self.joboffice.bb.queueLengths()
+        self.assertEquals(qlen.jobsInProgress, 0)
+        self.assertEquals(qlen.jobsDone, 1)
+        self.assertEquals(qlen.jobsAvailable, 0)
+        self.assertEquals(qlen.dataAvailable, 16)
 
       finally:
         self.joboffice.stop()
@@ -469,7 +492,58 @@ class DataTriggeredJobOfficeTestCase(unittest.TestCase):
             
 
 
-__all__ = "AbstractJobOfficeTestCase DataTriggeredJobOfficeTestCase".split()
+class ReceiveAnyDataEventTestCase(unittest.TestCase):
+
+    # a second data topic for the job office to listen to
+    topic2 = "PostISRAvailable2"
+
+    @classmethod
+    def setUpClass(cls):
+        if not brokerReachable(brokerhost):
+            raise unittest.SkipTest("event broker %s is unreachable" %
+                                    brokerhost)
+        cls.policy = Policy.createPolicy(policyFile)
+        cls.policy.add("listen.dataReadyEvent", cls.topic2)
+        cls.trxData2 = EventTransmitter(brokerhost, cls.topic2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.trxData2 = None
+
+    def setUp(self):
+        policy = Policy(self.policy, True)
+        self.testdir = tempfile.mkdtemp(prefix="ctrlsched_")
+        self.joboffice = DataTriggeredJobOffice(self.testdir, policy=policy, log=None, runId="testing", brokerHost=brokerhost)
+        self.joboffice.log.setThreshold(self.joboffice.log.WARN)
+
+    def tearDown(self):
+        self.joboffice = None
+        shutil.rmtree(self.testdir, ignore_errors=True)
+
+    def testReceiveFromSecondTopic(self):
+        self.assertEquals(len(self.joboffice.dataEvRcvrs), 2)
+
+        ps = PropertySet()
+        ps.set("pipelineName", "PostISR")
+        ps.set("STATUS", "available")
+        self.trxData2.publishEvent(StatusEvent("testing", originatorId, ps))
+
+        t0 = time.time()
+        event = self.joboffice.receiveAnyDataEvent(2000)
+        self.assert_(event is not None, "missed event on second data topic")
+        self.assert_(time.time() - t0 < 2.0, "event not returned in time")
+        self.assertEquals(event.getPropertySet().getString("pipelineName"),
+                          "PostISR")
+
+    def testReceiveNothing(self):
+        # the timeout is in milliseconds, not seconds
+        t0 = time.time()
+        self.assert_(self.joboffice.receiveAnyDataEvent(500) is None)
+        self.assert_(time.time() - t0 < 5.0, "timeout taken as seconds")
+
+
+__all__ = ("AbstractJobOfficeTestCase", "DataTriggeredJobOfficeTestCase",
+           "ReceiveAnyDataEventTestCase")
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
@@ -30,6 +30,8 @@ from __future__ import with_statement
 import pdb                              # we may want to say pdb.set_trace()
 import os
 import sys
+import shutil
+import tempfile
 import unittest
 import time
 
@@ -45,15 +47,34 @@ from lsst.pex.logging import Log
 # Log.getDefaultLog().setThreshold(Log.WARN)
 rootlogger = Log.getDefaultLog()
 rootlogger.setThreshold(Log.WARN)
+schedlogger = Log(rootlogger, "sched")
 
 
 testdir = os.path.join(os.environ["CTRL_SCHED_DIR"], "tests")
 exampledir = os.path.join(os.environ["CTRL_SCHED_DIR"], "examples")
-bbdir = os.path.join(testdir, "testbb")
 locations = PropertySet()
 locations.set("input", testdir)
 LogicalLocation.setLocationMap(locations)
 
+_schedPolicies = {}
+def _loadSchedulePolicy(filename):
+    """
+    return a private copy of the "schedule" policy from the named example
+    job office policy, parsing the file only the first time it is asked for.
+    A copy is returned because schedulers merge their defaults into the
+    policy they are given.
+    @param filename   the name of the policy file in the examples directory
+    """
+    if filename not in _schedPolicies:
+        policy = Policy.createPolicy(os.path.join(exampledir, filename))
+        _schedPolicies[filename] = policy.getPolicy("schedule")
+    return Policy(_schedPolicies[filename], True)
+
+# amps 0-13 of visit 88, used to complete the first job in the
+# DataTriggeredScheduler tests
+visit88amps = tuple(Dataset("PostISR", visitid=88, ccdid=22, snapid=0, ampid=i)
+                    for i in range(14))
+
 class AbstractSchedulerTestCase(unittest.TestCase):
 
     def setUp(self):
@@ -72,129 +93,120 @@ class AbstractSchedulerTestCase(unittest.TestCase):
 class DataTriggeredSchedulerTestCase(unittest.TestCase):
 
     def setUp(self):
-        self.bb = Blackboard(bbdir)
+        self.testdir = tempfile.mkdtemp(prefix="ctrlsched_")
+        self.bb = Blackboard(os.path.join(self.testdir, "testbb"))
         self.sched = None
-        self.logger = Log(rootlogger, "sched")
+        self.logger = schedlogger
         
     def tearDown(self):
         self.logger.setThreshold(Log.INHERIT_THRESHOLD)
-        if os.path.exists(bbdir):
-            os.system("rm -rf %s" % bbdir)
+        shutil.rmtree(self.testdir, ignore_errors=True)
         self.sched = None
 
     def testCtor(self):
-        policy = Policy.createPolicy(os.path.join(exampledir,
-                                                  "ccdassembly-joboffice.paf"))
-        spolicy = policy.getPolicy("schedule")
+        spolicy = _loadSchedulePolicy("ccdassembly-joboffice.paf")
         sched = DataTriggeredScheduler(self.bb, spolicy, self.logger)
 
-        self.assert_(sched.nametmpl is None)
-        self.assertEquals(sched.defaultName, "Job")
-        self.assertEquals(sched.nameNumber, 1)
-        self.assertEquals(len(sched.triggers), 1)
-        self.assertEquals(len(sched.inputdata), 1)
+        self.assertIsNone(sched.nametmpl)
+        self.assertEqual(sched.defaultName, "Job")
+        self.assertEqual(sched.nameNumber, 1)
+        self.assertEqual(len(sched.triggers), 1)
+        self.assertEqual(len(sched.inputdata), 1)
 
     def testCreateName(self):
-        policy = Policy.createPolicy(os.path.join(exampledir,
-                                                  "ccdassembly-joboffice.paf"))
-        spolicy = policy.getPolicy("schedule")
+        spolicy = _loadSchedulePolicy("ccdassembly-joboffice.paf")
         sched = DataTriggeredScheduler(self.bb, spolicy, self.logger)
         
         ds = Dataset("PostISR", ampid=3)
-        self.assertEquals(sched.createName(ds), "Job-1")
+        self.assertEqual(sched.createName(ds), "Job-1")
 
     def testCreateName2(self):
-        policy = Policy.createPolicy(os.path.join(exampledir,
-                                                  "ccdassembly-joboffice.paf"))
-        spolicy = policy.getPolicy("schedule")
+        spolicy = _loadSchedulePolicy("ccdassembly-joboffice.paf")
         spolicy.set("job.name.template", "%(type)s-v%(ampid)s")
         sched = DataTriggeredScheduler(self.bb, spolicy, self.logger)
         
         ds = Dataset("PostISR", ampid=3)
-        self.assertEquals(sched.createName(ds), "PostISR-v3")
+        self.assertEqual(sched.createName(ds), "PostISR-v3")
 
 
     def testProcessDataset(self):
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 0)
+        queues = self.bb.queues
+        self.assertEqual(self.bb.queueLengths().dataAvailable, 0)
 
-        policy = Policy.createPolicy(os.path.join(exampledir,
-                                                  "ccdassembly-joboffice.paf"))
-        spolicy = policy.getPolicy("schedule")
+        spolicy = _loadSchedulePolicy("ccdassembly-joboffice.paf")
         self.sched = DataTriggeredScheduler(self.bb, spolicy, self.logger)
 
         # pdb.set_trace()
         ds = Dataset("PostISR", visitid=88, ccdid=22, snapid=0, ampid=15)
         self.sched.processDataset(ds)
 
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 1)
-            self.assertEquals(self.bb.queues.jobsPossible.length(), 1)
-            job = self.bb.queues.jobsPossible.get(0)
-            self.assertEquals(job.getName(), "Job-1")
-            self.assertEquals(job.triggerHandler.getNeededDatasetCount(), 15)
-            self.assertEquals(self.sched.nameNumber, 2)
+        with queues:
+            self.assertEqual(queues.dataAvailable.length(), 1)
+            self.assertEqual(queues.jobsPossible.length(), 1)
+            job = queues.jobsPossible.get(0)
+            self.assertEqual(job.getName(), "Job-1")
+            self.assertEqual(job.triggerHandler.getNeededDatasetCount(), 15)
+            self.assertEqual(self.sched.nameNumber, 2)
     
         ds = Dataset("PostISR", visitid=95, ccdid=22, snapid=0, ampid=15)
         self.sched.processDataset(ds)
 
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 2)
-            self.assertEquals(self.bb.queues.jobsPossible.length(), 2)
-            job = self.bb.queues.jobsPossible.get(1)
-            self.assertEquals(job.getName(), "Job-2")
-            self.assertEquals(job.triggerHandler.getNeededDatasetCount(), 15)
+        with queues:
+            self.assertEqual(queues.dataAvailable.length(), 2)
+            self.assertEqual(queues.jobsPossible.length(), 2)
+            job = queues.jobsPossible.get(1)
+            self.assertEqual(job.getName(), "Job-2")
+            self.assertEqual(job.triggerHandler.getNeededDatasetCount(), 15)
             inputs = job.getInputDatasets()
-            self.assertEquals(len(inputs), 16)
-            self.assertEquals(inputs[0].type, "PostISR")
-            self.assertEquals(self.sched.nameNumber, 3)
+            self.assertEqual(len(inputs), 16)
+            self.assertEqual(inputs[0].type, "PostISR")
+            self.assertEqual(self.sched.nameNumber, 3)
 
         ds = Dataset("PostISR", visitid=88, ccdid=22, snapid=0, ampid=14)
         self.sched.processDataset(ds)
 
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 3)
-            self.assertEquals(self.bb.queues.jobsPossible.length(), 2)
-            job = self.bb.queues.jobsPossible.get(0)
-            self.assertEquals(job.triggerHandler.getNeededDatasetCount(), 14)
+        with queues:
+            self.assertEqual(queues.dataAvailable.length(), 3)
+            self.assertEqual(queues.jobsPossible.length(), 2)
+            job = queues.jobsPossible.get(0)
+            self.assertEqual(job.triggerHandler.getNeededDatasetCount(), 14)
 
         # pdb.set_trace()
-        for i in xrange(14):
-            ds = Dataset("PostISR", visitid=88, ccdid=22, snapid=0, ampid=i)
-            self.sched.processDataset(ds)
+        self.assertEqual(self.sched.processDatasets(visit88amps), 14)
 
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 17)
-            self.assertEquals(self.bb.queues.jobsPossible.length(), 2)
-            job = self.bb.queues.jobsPossible.get(0)
-            self.assertEquals(job.triggerHandler.getNeededDatasetCount(), 0)
-            self.assert_(job.isReady())
+        with queues:
+            self.assertEqual(queues.dataAvailable.length(), 17)
+            self.assertEqual(queues.jobsPossible.length(), 2)
+            job = queues.jobsPossible.get(0)
+            self.assertEqual(job.triggerHandler.getNeededDatasetCount(), 0)
+            self.assertTrue(job.isReady())
 
     def testMakeAvail(self):
+        queues = self.bb.queues
         self.testProcessDataset()
 
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 17)
-            self.assertEquals(self.bb.queues.jobsAvailable.length(), 0)
-            self.assertEquals(self.bb.queues.jobsPossible.length(), 2)
-            job = self.bb.queues.jobsPossible.get(0)
-            self.assertEquals(job.getName(), "Job-1")
-            self.assert_(job.isReady())
-            job = self.bb.queues.jobsPossible.get(1)
-            self.assertEquals(job.getName(), "Job-2")
-            self.assert_(not job.isReady())
+        with queues:
+            self.assertEqual(queues.dataAvailable.length(), 17)
+            self.assertEqual(queues.jobsAvailable.length(), 0)
+            self.assertEqual(queues.jobsPossible.length(), 2)
+            job = queues.jobsPossible.get(0)
+            self.assertEqual(job.getName(), "Job-1")
+            self.assertTrue(job.isReady())
+            job = queues.jobsPossible.get(1)
+            self.assertEqual(job.getName(), "Job-2")
+            self.assertFalse(job.isReady())
 
         self.sched.makeJobsAvailable()
 
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 17)
-            self.assertEquals(self.bb.queues.jobsAvailable.length(), 1)
-            self.assertEquals(self.bb.queues.jobsPossible.length(), 1)
-            job = self.bb.queues.jobsPossible.get(0)
-            self.assertEquals(job.getName(), "Job-2")
-            self.assert_(not job.isReady())
-            job = self.bb.queues.jobsAvailable.get(0)
-            self.assertEquals(job.getName(), "Job-1")
+        with queues:
+            self.assertEqual(queues.dataAvailable.length(), 17)
+            self.assertEqual(queues.jobsAvailable.length(), 1)
+            self.assertEqual(queues.jobsPossible.length(), 1)
+            job = queues.jobsPossible.get(0)
+            self.assertEqual(job.getName(), "Job-2")
+            self.assertFalse(job.isReady())
+            job = queues.jobsAvailable.get(0)
+            self.assertEqual(job.getName(), "Job-1")
 
 idpolicy = """#<?cfg paf policy ?>
   datasetType:  PostISR-CCD
@@ -209,23 +221,21 @@ class DataTriggeredSchedulerTestCase2(unittest.TestCase):
     """
 
     def setUp(self):
-        self.bb = Blackboard(bbdir)
+        self.testdir = tempfile.mkdtemp(prefix="ctrlsched_")
+        self.bb = Blackboard(os.path.join(self.testdir, "testbb"))
         self.sched = None
-        self.logger = Log(rootlogger, "sched")
+        self.logger = schedlogger
         
     def tearDown(self):
         self.logger.setThreshold(Log.INHERIT_THRESHOLD)
-        if os.path.exists(bbdir):
-            os.system("rm -rf %s" % bbdir)
+        shutil.rmtree(self.testdir, ignore_errors=True)
         self.sched = None
 
     def testProcessDataset(self):
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 0)
+        queues = self.bb.queues
+        self.assertEqual(self.bb.queueLengths().dataAvailable, 0)
 
-        policy = Policy.createPolicy(os.path.join(exampledir,
-                                                  "ccdassembly-joboffice.paf"))
-        spolicy = policy.getPolicy("schedule")
+        spolicy = _loadSchedulePolicy("ccdassembly-joboffice.paf")
 
         # manipulate the policy
         idp = Policy.createPolicy(PolicyString(idpolicy))
@@ -237,154 +247,136 @@ class DataTriggeredSchedulerTestCase2(unittest.TestCase):
         ds = Dataset("PostISR", visitid=88, ccdid=22, snapid=0, ampid=15)
         self.sched.processDataset(ds)
 
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 1)
-            self.assertEquals(self.bb.queues.jobsPossible.length(), 1)
-            job = self.bb.queues.jobsPossible.get(0)
-            self.assertEquals(job.getName(), "Job-1")
-            self.assertEquals(job.triggerHandler.getNeededDatasetCount(), 15)
-            self.assertEquals(self.sched.nameNumber, 2)
+        with queues:
+            self.assertEqual(queues.dataAvailable.length(), 1)
+            self.assertEqual(queues.jobsPossible.length(), 1)
+            job = queues.jobsPossible.get(0)
+            self.assertEqual(job.getName(), "Job-1")
+            self.assertEqual(job.triggerHandler.getNeededDatasetCount(), 15)
+            self.assertEqual(self.sched.nameNumber, 2)
     
         ds = Dataset("PostISR", visitid=95, ccdid=22, snapid=0, ampid=15)
         self.sched.processDataset(ds)
 
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 2)
-            self.assertEquals(self.bb.queues.jobsPossible.length(), 2)
-            job = self.bb.queues.jobsPossible.get(1)
-            self.assertEquals(job.getName(), "Job-2")
-            self.assertEquals(job.triggerHandler.getNeededDatasetCount(), 15)
+        with queues:
+            self.assertEqual(queues.dataAvailable.length(), 2)
+            self.assertEqual(queues.jobsPossible.length(), 2)
+            job = queues.jobsPossible.get(1)
+            self.assertEqual(job.getName(), "Job-2")
+            self.assertEqual(job.triggerHandler.getNeededDatasetCount(), 15)
             inputs = job.getInputDatasets()
-            self.assertEquals(len(inputs), 16)
-            self.assertEquals(inputs[0].type, "PostISR")
-            self.assertEquals(self.sched.nameNumber, 3)
+            self.assertEqual(len(inputs), 16)
+            self.assertEqual(inputs[0].type, "PostISR")
+            self.assertEqual(self.sched.nameNumber, 3)
 
         ds = Dataset("PostISR", visitid=88, ccdid=22, snapid=0, ampid=14)
         self.sched.processDataset(ds)
 
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 3)
-            self.assertEquals(self.bb.queues.jobsPossible.length(), 2)
-            job = self.bb.queues.jobsPossible.get(0)
-            self.assertEquals(job.triggerHandler.getNeededDatasetCount(), 14)
+        with queues:
+            self.assertEqual(queues.dataAvailable.length(), 3)
+            self.assertEqual(queues.jobsPossible.length(), 2)
+            job = queues.jobsPossible.get(0)
+            self.assertEqual(job.triggerHandler.getNeededDatasetCount(), 14)
 
         # pdb.set_trace()
-        for i in xrange(14):
-            ds = Dataset("PostISR", visitid=88, ccdid=22, snapid=0, ampid=i)
-            self.sched.processDataset(ds)
+        self.assertEqual(self.sched.processDatasets(visit88amps), 14)
 
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 17)
-            self.assertEquals(self.bb.queues.jobsPossible.length(), 2)
-            job = self.bb.queues.jobsPossible.get(0)
-            self.assertEquals(job.triggerHandler.getNeededDatasetCount(), 0)
-            self.assert_(job.isReady())
+        with queues:
+            self.assertEqual(queues.dataAvailable.length(), 17)
+            self.assertEqual(queues.jobsPossible.length(), 2)
+            job = queues.jobsPossible.get(0)
+            self.assertEqual(job.triggerHandler.getNeededDatasetCount(), 0)
+            self.assertTrue(job.isReady())
 
         
 class ButlerTriggeredSchedulerTestCase(unittest.TestCase):
 
     def setUp(self):
-        self.bb = Blackboard(bbdir)
+        self.testdir = tempfile.mkdtemp(prefix="ctrlsched_")
+        self.bb = Blackboard(os.path.join(self.testdir, "testbb"))
         self.sched = None
-        self.logger = Log(rootlogger, "sched")
+        self.logger = schedlogger
         
     def tearDown(self):
-        if os.path.exists(bbdir):
-            os.system("rm -rf %s" % bbdir)
+        self.logger.setThreshold(Log.INHERIT_THRESHOLD)
+        shutil.rmtree(self.testdir, ignore_errors=True)
         self.sched = None
 
     def testCtor(self):
-        policy = Policy.createPolicy(os.path.join(exampledir,
-                                                  "srcAssoc-joboffice.paf"))
-        spolicy = policy.getPolicy("schedule")
+        spolicy = _loadSchedulePolicy("srcAssoc-joboffice.paf")
         sched = ButlerTriggeredScheduler(self.bb, spolicy, self.logger)
 
-        self.assert_(sched.nametmpl is None)
-        self.assertEquals(sched.defaultName, "Job")
-        self.assertEquals(sched.nameNumber, 1)
-        self.assertEquals(len(sched.triggers), 1)
-        self.assertEquals(len(sched.inputdata), 1)
+        self.assertIsNone(sched.nametmpl)
+        self.assertEqual(sched.defaultName, "Job")
+        self.assertEqual(sched.nameNumber, 1)
+        self.assertEqual(len(sched.triggers), 1)
+        self.assertEqual(len(sched.inputdata), 1)
 
     def testCreateName(self):
-        policy = Policy.createPolicy(os.path.join(exampledir,
-                                                  "srcAssoc-joboffice.paf"))
-        spolicy = policy.getPolicy("schedule")
+        spolicy = _loadSchedulePolicy("srcAssoc-joboffice.paf")
         sched = ButlerTriggeredScheduler(self.bb, spolicy, self.logger)
         
         ds = Dataset("PostISR", ampid=3)
-        self.assertEquals(sched.createName(ds), "Job-1")
+        self.assertEqual(sched.createName(ds), "Job-1")
 
     def testProcessDataset(self):
+        queues = self.bb.queues
         # self.logger.setThreshold(Log.DEBUG)
         
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 0)
+        self.assertEqual(self.bb.queueLengths().dataAvailable, 0)
 
-        policy = Policy.createPolicy(os.path.join(exampledir,
-                                                  "srcAssoc-joboffice.paf"))
-        spolicy = policy.getPolicy("schedule")
+        spolicy = _loadSchedulePolicy("srcAssoc-joboffice.paf")
         self.sched = ButlerTriggeredScheduler(self.bb, spolicy, self.logger)
 
         # pdb.set_trace()
         ds = Dataset("src", visit=85408535, raft="2,2", sensor="2,2")
         self.sched.processDataset(ds)
 
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 1)
-            self.assertEquals(self.bb.queues.jobsPossible.length(), 1)
-            job = self.bb.queues.jobsPossible.get(0)
-            self.assertEquals(job.getName(), "Job-1")
-            self.assertEquals(job.triggerHandler.getNeededDatasetCount(), 14)
-            self.assertEquals(len(job.getInputDatasets()), 15)
+        with queues:
+            self.assertEqual(queues.dataAvailable.length(), 1)
+            self.assertEqual(queues.jobsPossible.length(), 1)
+            job = queues.jobsPossible.get(0)
+            self.assertEqual(job.getName(), "Job-1")
+            self.assertEqual(job.triggerHandler.getNeededDatasetCount(), 14)
+            self.assertEqual(len(job.getInputDatasets()), 15)
             ods = job.getOutputDatasets()
-            self.assertEquals(len(ods), 7)
-            self.assertEquals(ods[0].type, "source")
-            self.assert_(ods[0].ids.has_key("skyTile"))
-            self.assertEquals(self.sched.nameNumber, 2)
+            self.assertEqual(len(ods), 7)
+            self.assertEqual(ods[0].type, "source")
+            self.assertIn("skyTile", ods[0].ids)
+            self.assertEqual(self.sched.nameNumber, 2)
     
         # pdb.set_trace()
-        dss = [ Dataset("src", visit=85408535, raft="2,2", sensor="0,2"),
-                Dataset("src", visit=85408535, raft="2,2", sensor="1,1"),
-                Dataset("src", visit=85408535, raft="2,2", sensor="1,2"),
-                Dataset("src", visit=85408535, raft="2,2", sensor="2,0"),
-                Dataset("src", visit=85408535, raft="2,2", sensor="2,1"),
-                Dataset("src", visit=85408535, raft="2,3", sensor="1,0"),
-                Dataset("src", visit=85408535, raft="2,3", sensor="2,0"),
-                Dataset("src", visit=85408535, raft="2,3", sensor="2,1"),
-                Dataset("src", visit=85408535, raft="3,2", sensor="0,0"),
-                Dataset("src", visit=85408535, raft="3,2", sensor="0,1"),
-                Dataset("src", visit=85408535, raft="3,2", sensor="0,2"),
-                Dataset("src", visit=85408535, raft="3,2", sensor="1,2"),
-                Dataset("src", visit=85408535, raft="3,3", sensor="1,0") ]
-
-        i = 1
-        for ds in dss:
-            # pdb.set_trace()
-            self.sched.processDataset(ds)
-            i += 1
-            
-            with self.bb.queues:
-                self.assertEquals(self.bb.queues.dataAvailable.length(), i)
-                job = self.bb.queues.jobsPossible.get(0)
-                self.assertEquals(job.triggerHandler.getNeededDatasetCount(),
-                                  15-i)
-                
-        with self.bb.queues:
+        raftSensors = [("2,2", "0,2"), ("2,2", "1,1"), ("2,2", "1,2"),
+                       ("2,2", "2,0"), ("2,2", "2,1"), ("2,3", "1,0"),
+                       ("2,3", "2,0"), ("2,3", "2,1"), ("3,2", "0,0"),
+                       ("3,2", "0,1"), ("3,2", "0,2"), ("3,2", "1,2"),
+                       ("3,3", "1,0")]
+        dss = [Dataset("src", visit=85408535, raft=raft, sensor=sensor)
+               for raft, sensor in raftSensors]
+
+        self.assertEqual(self.sched.processDatasets(dss), len(dss))
+
+        with queues:
+            self.assertEqual(queues.dataAvailable.length(), 14)
+            job = queues.jobsPossible.get(0)
+            self.assertEqual(job.getName(), "Job-1")
+            self.assertEqual(job.triggerHandler.getNeededDatasetCount(), 1)
+
             # 9 is empirical; is it really right, though?
-            self.assertEquals(self.bb.queues.jobsPossible.length(), 9)
+            self.assertEqual(queues.jobsPossible.length(), 9)
 
         # pdb.set_trace()
         ds = Dataset("src", visit=85408535, raft="3,3", sensor="0,0")
         self.sched.processDataset(ds)
 
-        with self.bb.queues:
-            self.assertEquals(self.bb.queues.dataAvailable.length(), 15)
-            job = self.bb.queues.jobsPossible.get(0)
-            self.assertEquals(job.triggerHandler.getNeededDatasetCount(), 0)
-            self.assert_(job.isReady())
-            job = self.bb.queues.jobsPossible.get(1)
-            self.assertEquals(job.getName(), "Job-2")
-            self.assert_(not job.isReady())
+        with queues:
+            self.assertEqual(queues.dataAvailable.length(), 15)
+            job = queues.jobsPossible.get(0)
+            self.assertEqual(job.triggerHandler.getNeededDatasetCount(), 0)
+            self.assertTrue(job.isReady())
+            job = queues.jobsPossible.get(1)
+            self.assertEqual(job.getName(), "Job-2")
+            self.assertFalse(job.isReady())
 
         
     
@@ -34,6 +34,7 @@ import unittest
 import time
 
 from lsst.ctrl.events import EventSystem, EventReceiver, Event, CommandEvent
+from lsst.ctrl.sched.utils import brokerReachable
 
 sendevent = os.path.join(os.environ["CTRL_SCHED_DIR"], "bin", "sendevent.py")
 seargs = " -b %s -r %s -n %s -o %d %s %s %s"
@@ -47,44 +48,47 @@ class SendEventTestCase(unittest.TestCase):
         self.topic = "test"
         self.broker = "lsst8.ncsa.uiuc.edu"
         self.runid = "test1"
+        if not brokerReachable(self.broker):
+            self.skipTest("event broker %s is unreachable" % self.broker)
+
+        # subscribe all of our receivers up front so that a single
+        # invocation of sendevent.py can be checked by several selectors
+        self.rcvrBad = EventReceiver(self.broker, self.topic, "RUNID='goob'")
+        self.rcvrRunId = EventReceiver(self.broker, self.topic,
+                                       "RUNID='%s'" % self.runid)
+        self.rcvrStatus = EventReceiver(self.broker, self.topic,
+                                        "RUNID='%s' and STATUS='%s'" %
+                                        (self.runid, "job:ready"))
+        selector = "%s='%s' and %s='%s' and %s=%d" % \
+                   (Event.RUNID, self.runid, Event.STATUS, "job:assign",
+                    CommandEvent.DESTINATIONID, origid)
+        self.rcvrDest = EventReceiver(self.broker, self.topic, selector)
         
     def tearDown(self):
-        pass
+        self.rcvrBad = self.rcvrRunId = None
+        self.rcvrStatus = self.rcvrDest = None
 
     def testReady(self):
-        rcvr = EventReceiver(self.broker, self.topic,
-                             "RUNID='goob'")
         args = seargs % (self.broker, self.runid, "testPipe", origid, "ready", 
                          self.topic, "testPipe")
         print sendevent+args
         os.system(sendevent+args)
-        event = rcvr.receiveEvent(500)
+        event = self.rcvrBad.receiveEvent(500)
         self.assert_(event is None)
-
-        rcvr = EventReceiver(self.broker, self.topic,
-                             "RUNID='%s'" % self.runid)
-        os.system(sendevent+args)
-        event = rcvr.receiveEvent(500)
+        event = self.rcvrRunId.receiveEvent(500)
         self.assert_(event is not None, "generic event not selected")
-        os.system(sendevent+args)
-        event = rcvr.receiveStatusEvent(500)
-        self.assert_(event is not None,  "failed to cast to status event")
+        event = self.rcvrStatus.receiveStatusEvent(500)
+        self.assert_(event is not None,  "status event not selected on status")
 
-        rcvr = EventReceiver(self.broker, self.topic,
-                             "RUNID='%s' and STATUS='%s'" % (self.runid, "job:ready"))
         os.system(sendevent+args)
-        event = rcvr.receiveStatusEvent(500)
-        self.assert_(event is not None,  "status event not selected on status")
+        event = self.rcvrRunId.receiveStatusEvent(500)
+        self.assert_(event is not None,  "failed to cast to status event")
 
-        selector = "%s='%s' and %s='%s' and %s=%d" % (Event.RUNID, self.runid, Event.STATUS, "job:assign", CommandEvent.DESTINATIONID, origid)
-#        selector = "DESTINATIONID = %d" % (origid)
-        print selector
-        rcvr = EventReceiver(self.broker, self.topic, selector)
         args = seargs % (self.broker, self.runid, "testPipe", origid, "assign",
                          self.topic, "testPipe")
         print sendevent+args
         os.system(sendevent+args)
-        event = rcvr.receiveCommandEvent(500)
+        event = self.rcvrDest.receiveCommandEvent(500)
         self.assert_(event is not None,  "status event not selected on destination")
 
 
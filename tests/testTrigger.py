@@ -27,16 +27,12 @@ Tests of the Trigger classes
 """
 from __future__ import with_statement
 
-import pdb                              # we may want to say pdb.set_trace()
 import os
-import sys
 import unittest
-import time
-import copy
 
 from lsst.ctrl.sched.joboffice.triggers import Trigger, SimpleTrigger, MapperTrigger
 from lsst.ctrl.sched import Dataset
-from lsst.ctrl.sched.joboffice.id import IDFilter, IntegerIDFilter
+from lsst.ctrl.sched.joboffice.id import IntegerIDFilter
 from lsst.pex.policy import Policy, DefaultPolicyFile
 from lsst.daf.persistence import LogicalLocation
 from lsst.daf.base import PropertySet
@@ -45,9 +41,6 @@ from lsst.pex.logging import Log
 Log.getDefaultLog().setThreshold(Log.WARN)
 
 testdir = os.path.join(os.environ['CTRL_SCHED_DIR'], 'tests')
-locations = PropertySet()
-locations.set("input", testdir)
-LogicalLocation.setLocationMap(locations)
 
 class AbstractTriggerTestCase(unittest.TestCase):
 
@@ -61,7 +54,14 @@ class AbstractTriggerTestCase(unittest.TestCase):
 
     def testNoRecognizeImpl(self):
         t = Trigger(fromSubclass=True)
-        self.assert_(t.recognize(None) is None)
+        self.assertIsNone(t.recognize(None))
+
+# (dataset ids, whether SimpleTriggerTestCase's id filters recognize them)
+ID_CASES = (({}, False),
+            ({"ccd": 5, "amp": 0}, False),
+            ({"ccd": 5, "amp": 0, "visit": 88}, True),
+            ({"ccd": 5, "amp": 0, "visit": 88, "filt": 'r'}, True),
+            ({"ccd": 5, "amp": 0, "visit": 89, "filt": 'r'}, False))
 
 class SimpleTriggerTestCase(unittest.TestCase):
 
@@ -82,84 +82,62 @@ class SimpleTriggerTestCase(unittest.TestCase):
             t = SimpleTrigger(self.type)
 
         ds = Dataset("goob")
-        self.assert_(not t.recognize(ds))
+        self.assertFalse(t.recognize(ds))
 
         ds = Dataset(self.type)
-        self.assert_(t.recognize(ds))
+        self.assertTrue(t.recognize(ds))
 
     def testDatasetType2(self, t=None):
         if not t:
             t = SimpleTrigger([self.type, "Decal"])
 
         ds = Dataset("goob")
-        self.assert_(not t.recognize(ds))
+        self.assertFalse(t.recognize(ds))
 
         ds = Dataset(self.type)
-        self.assert_(t.recognize(ds))
+        self.assertTrue(t.recognize(ds))
         ds = Dataset("Decal")
-        self.assert_(t.recognize(ds))
+        self.assertTrue(t.recognize(ds))
+
 
+    def _checkIds(self, t):
+        for ids, expected in ID_CASES:
+            ds = Dataset(self.type, **ids)
+            self.assertEqual(bool(t.recognize(ds)), expected,
+                             "recognize(%s) != %s" % (ds, expected))
 
     def testIds(self, t=None):
         if not t:
             t = SimpleTrigger(self.type, self.idd)
-        
-        ds = Dataset(self.type)
-        self.assert_(not t.recognize(ds))
-
-        ds = Dataset(self.type, ccd=5, amp=0)
-        self.assert_(not t.recognize(ds))
-
-        ds = Dataset(self.type, ccd=5, amp=0, visit=88)
-        self.assert_(t.recognize(ds))
-
-        ds = Dataset(self.type, ccd=5, amp=0, visit=88, filt='r')
-        self.assert_(t.recognize(ds))
-
-        ds = Dataset(self.type, ccd=5, amp=0, visit=89, filt='r')
-        self.assert_(not t.recognize(ds))
+        self._checkIds(t)
 
     def testIds2(self, t=None):
         if not t:
             t = SimpleTrigger(ids=self.idd)
-        
-        ds = Dataset(self.type)
-        self.assert_(not t.recognize(ds))
-
-        ds = Dataset(self.type, ccd=5, amp=0)
-        self.assert_(not t.recognize(ds))
-
-        ds = Dataset(self.type, ccd=5, amp=0, visit=88)
-        self.assert_(t.recognize(ds))
-
-        ds = Dataset(self.type, ccd=5, amp=0, visit=88, filt='r')
-        self.assert_(t.recognize(ds))
-
-        ds = Dataset(self.type, ccd=5, amp=0, visit=89, filt='r')
-        self.assert_(not t.recognize(ds))
+        self._checkIds(t)
 
     def testListDatasets(self):
         t = SimpleTrigger(self.type, self.idd)
-        self.assert_(t.hasPredictableDatasetList())
+        self.assertTrue(t.hasPredictableDatasetList())
 
         ds = Dataset(self.type, ccd=5, amp=0, visit=88, filt='r')
         dss = t.listDatasets(ds)
-        self.assertEquals(len(dss), 8*16*1)
-        self.assertEquals(dss[0].ids["visit"], 88)
-        self.assert_(dss[0].ids.has_key("filt"))
-        self.assertEquals(dss[0].ids["filt"], 'r')
+        self.assertEqual(len(dss), 8*16*1)
+        self.assertEqual(dss[0].ids["visit"], 88)
+        self.assertIn("filt", dss[0].ids)
+        self.assertEqual(dss[0].ids["filt"], 'r')
         for ds in dss:
-            self.assert_(t.recognize(ds), "failed to recognize " + str(ds))
+            self.assertTrue(t.recognize(ds), "failed to recognize " + str(ds))
 
         idd = dict(self.idd)
         idd["visit"] = IntegerIDFilter("visit", min=87)
         t = SimpleTrigger(self.type, idd)
-        self.assert_(not t.hasPredictableDatasetList())
+        self.assertFalse(t.hasPredictableDatasetList())
         dss = t.listDatasets(ds)
-        self.assertEquals(len(dss), 8*16*1)
-        self.assertEquals(dss[0].ids["visit"], 88)
-        self.assert_(dss[0].ids.has_key("filt"))
-        self.assertEquals(dss[0].ids["filt"], 'r')
+        self.assertEqual(len(dss), 8*16*1)
+        self.assertEqual(dss[0].ids["visit"], 88)
+        self.assertIn("filt", dss[0].ids)
+        self.assertEqual(dss[0].ids["filt"], 'r')
 
 
     def testFromPolicy(self):
@@ -205,41 +183,49 @@ testds = Dataset("src",
 
 class MapperTriggerTestCase(unittest.TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
+        # the mapper finds its registry via the "input" logical location
+        locations = PropertySet()
+        locations.set("input", testdir)
+        LogicalLocation.setLocationMap(locations)
+
         example = DefaultPolicyFile("ctrl_sched", "srcAssoc-joboffice.paf",
                                     "examples")
-        self.schedpolicy = Policy.createPolicy(example)
-        self.tpolicy = self.schedpolicy.get("schedule.trigger")
-        self.trigger = None
+        cls.schedpolicy = Policy.createPolicy(example)
+
+        # the trigger (and its mapper) is not changed by the tests, so
+        # build it just once from a copy of the trigger policy
+        tpolicy = cls.schedpolicy.get("schedule.trigger")
+        cls.trigger = Trigger.fromPolicy(Policy(tpolicy, True))
+
+    def setUp(self):
+        self.tpolicy = Policy(self.schedpolicy.get("schedule.trigger"), True)
 
     def tearDown(self):
         pass
 
     def testPolicyOK(self):
-        self.assertEquals(self.tpolicy.get("className"), "MapperTrigger")
+        self.assertEqual(self.tpolicy.get("className"), "MapperTrigger")
 
     def testFromPolicy(self):
-        self.trigger = Trigger.fromPolicy(self.tpolicy)
-        self.assert_(isinstance(self.trigger, MapperTrigger))
+        trigger = Trigger.fromPolicy(self.tpolicy)
+        self.assertIsInstance(trigger, MapperTrigger)
 
     def testRecognize(self):
-        self.testFromPolicy()
-        self.assert_(self.trigger.recognize(testds))
+        self.assertTrue(self.trigger.recognize(testds))
 
     def testNoRecognize(self):
-        ds = copy.deepcopy(testds)
-        ds.type = "goob"
+        ds = Dataset("goob", ids=dict(testds.ids))
         
-        self.testFromPolicy()
-        self.assert_(not self.trigger.recognize(ds))
+        self.assertFalse(self.trigger.recognize(ds))
 
     def testListJobs(self):
-        self.testFromPolicy()
         jobs = self.trigger.listDatasets(testds)
-        self.assertEquals(len(jobs), 1)
-        self.assertEquals(jobs[0].type, 'source')
-        self.assert_(jobs[0].ids.has_key('skyTile'))
-        self.assertEquals(jobs[0].ids['skyTile'], 95127)
+        self.assertEqual(len(jobs), 1)
+        self.assertEqual(jobs[0].type, 'source')
+        self.assertIn('skyTile', jobs[0].ids)
+        self.assertEqual(jobs[0].ids['skyTile'], 95127)
         
     def testListJobs2(self):
         policy = self.schedpolicy.get("schedule.job.input")
@@ -247,12 +233,12 @@ class MapperTriggerTestCase(unittest.TestCase):
         ds = Dataset("goob", ids={ "skyTile": 95127 })
 
         inputs = trigger.listDatasets(ds)
-        self.assertEquals(len(inputs), 8)
-        self.assertEquals(inputs[0].type, 'src')
-        self.assert_(inputs[0].ids.has_key('visit'))
-        self.assert_(inputs[0].ids.has_key('raft'))
-        self.assert_(inputs[0].ids.has_key('sensor'))
-        self.assertEquals(inputs[0].ids['visit'], 85408535)
+        self.assertEqual(len(inputs), 8)
+        self.assertEqual(inputs[0].type, 'src')
+        self.assertIn('visit', inputs[0].ids)
+        self.assertIn('raft', inputs[0].ids)
+        self.assertIn('sensor', inputs[0].ids)
+        self.assertEqual(inputs[0].ids['visit'], 85408535)
         
 
 __all__ = "AbstractTriggerTestCase SimpleTriggerTestCase".split()
@@ -27,11 +27,7 @@ Tests of the TriggerHandler classes
 """
 from __future__ import with_statement
 
-import pdb                              # we may want to say pdb.set_trace()
-import os
-import sys
 import unittest
-import time
 
 from lsst.ctrl.sched.joboffice.triggerHandlers import *
 
@@ -47,51 +43,49 @@ class AbstractTriggerHandlerTestCase(unittest.TestCase):
 
     def testNoRecognizeImpl(self):
         t = TriggerHandler(fromSubclass=True)
-        self.assert_(not t.isReady())
+        self.assertFalse(t.isReady())
         self.assertRaises(RuntimeError, t.addDataset, None)
 
+# the order in which testAdd adds the datasets in dslist, with the number
+# still needed after each addition
+ADD_SEQUENCE = ((1, 2), (0, 1), (2, 0))
+
 class FilesetTriggerHandlerTestCase(unittest.TestCase):
 
     def setUp(self):
         self.dslist = [ Dataset("SrcList", visit=32),
                         Dataset("SrcList", visit=33),
                         Dataset("SrcList", visit=35) ]
+        self.keys = [str(ds) for ds in self.dslist]
     def tearDown(self):
         pass
 
     def testCtor(self):
         th = FilesetTriggerHandler()
-        self.assertEquals(th.getNeededDatasetCount(), 0)
-        self.assert_(th.isReady())
+        self.assertEqual(th.getNeededDatasetCount(), 0)
+        self.assertTrue(th.isReady())
 
         th = FilesetTriggerHandler(self.dslist[0])
-        self.assertEquals(th.getNeededDatasetCount(), 1)
-        self.assert_(not th.isReady())
-        self.assert_(str(self.dslist[0]) in th.dids)
+        self.assertEqual(th.getNeededDatasetCount(), 1)
+        self.assertFalse(th.isReady())
+        self.assertIn(self.keys[0], th.dids)
 
         th = FilesetTriggerHandler(self.dslist)
-        self.assertEquals(th.getNeededDatasetCount(), 3)
-        self.assert_(not th.isReady())
-        self.assert_(str(self.dslist[0]) in th.dids)
-        self.assert_(str(self.dslist[1]) in th.dids)
-        self.assert_(str(self.dslist[2]) in th.dids)
+        self.assertEqual(th.getNeededDatasetCount(), 3)
+        self.assertFalse(th.isReady())
+        for key in self.keys:
+            self.assertIn(key, th.dids)
 
     def testAdd(self):
         th = FilesetTriggerHandler(self.dslist)
-        self.assertEquals(th.getNeededDatasetCount(), 3)
-        self.assert_(not th.isReady())
-
-        th.addDataset(self.dslist[1])
-        self.assertEquals(th.getNeededDatasetCount(), 2)
-        self.assert_(not th.isReady())
-
-        th.addDataset(self.dslist[0])
-        self.assertEquals(th.getNeededDatasetCount(), 1)
-        self.assert_(not th.isReady())
-
-        th.addDataset(self.dslist[2])
-        self.assertEquals(th.getNeededDatasetCount(), 0)
-        self.assert_(th.isReady())
+        self.assertEqual(th.getNeededDatasetCount(), 3)
+        self.assertFalse(th.isReady())
+
+        for i, needed in ADD_SEQUENCE:
+            th.addDataset(self.dslist[i])
+            self.assertEqual(th.getNeededDatasetCount(), needed,
+                             "wrong count after adding dataset %d" % i)
+            self.assertEqual(th.isReady(), needed == 0)
 
 
 __all__ = "AbstractTriggerHandlerTestCase FilesetTriggerHandlerTestCase".split()
@@ -27,11 +27,9 @@ Tests of the scheduler classes
 """
 from __future__ import with_statement
 
-import pdb                              # we may want to say pdb.set_trace()
-import os
 import sys
+import socket
 import unittest
-import time
 import copy
 import random
 
@@ -62,140 +60,169 @@ class RunIdTestCase(unittest.TestCase):
     def testCreateDef(self):
         # pdb.set_trace()
         runid = utils.createRunId()
-        self.assert_(runid.startswith("test"))
-        self.assertEquals(len(runid), 9, "wrong length: " + runid)
-        self.assertNotEquals(utils.createRunId(), runid,
-                             "created duplicate runids: " + runid)
+        self.assertTrue(runid.startswith("test"))
+        self.assertEqual(len(runid), 9, "wrong length: " + runid)
+        self.assertNotEqual(utils.createRunId(), runid,
+                            "created duplicate runids: " + runid)
 
     def testCreateWBase(self):
         runid = utils.createRunId(self.base)
-        self.assert_(runid.startswith(self.base))
-        self.assertEquals(len(runid), len(self.base)+5,
-                          "wrong length: " + runid)
-        self.assertNotEquals(utils.createRunId(self.base), runid,
-                             "created duplicate runids: " + runid)
+        self.assertTrue(runid.startswith(self.base))
+        self.assertEqual(len(runid), len(self.base)+5,
+                         "wrong length: " + runid)
+        self.assertNotEqual(utils.createRunId(self.base), runid,
+                            "created duplicate runids: " + runid)
 
     def testCreateWLim(self):
         runid = utils.createRunId(self.base, self.lim)
-        self.assert_(runid.startswith(self.base))
-        self.assertEquals(len(runid), len(self.base)+len(str(self.lim))-1,
-                          "wrong length for lim=%d: %s" % (self.lim, runid))
-        self.assertNotEquals(utils.createRunId(self.base, self.lim), runid,
-                             "created duplicate runids: " + runid)
+        self.assertTrue(runid.startswith(self.base))
+        self.assertEqual(len(runid), len(self.base)+len(str(self.lim))-1,
+                         "wrong length for lim=%d: %s" % (self.lim, runid))
+
+        # with only 1000 possible random suffixes, a repeat is possible;
+        # sequence numbers guarantee distinct ids
+        runid = utils.createRunId(self.base, self.lim, 7)
+        self.assertEqual(runid, self.base+"007")
+        self.assertNotEqual(utils.createRunId(self.base, self.lim, 8), runid,
+                            "created duplicate runids: " + runid)
+
+class BrokerProbeTestCase(unittest.TestCase):
+
+    def testReachable(self):
+        server = socket.socket()
+        server.bind(("localhost", 0))
+        server.listen(1)
+        port = server.getsockname()[1]
+        try:
+            self.assertTrue(utils.brokerReachable("localhost", port))
+        finally:
+            server.close()
+        self.assertFalse(utils.brokerReachable("localhost", port))
 
 class EventSenderTestCase(unittest.TestCase):
 
-    def setUp(self):
-        self.topic = "testtopic"
-        self.runid = utils.createRunId()
-        self.sender = utils.EventSender(self.runid, self.topic, brokerhost)
-        self.rcvr = EventReceiver(brokerhost, self.topic,
-                                  "RUNID='%s'" % self.runid)
-
-    def tearDown(self):
-        self.sender = None
+    @classmethod
+    def setUpClass(cls):
+        if not utils.brokerReachable(brokerhost):
+            raise unittest.SkipTest("event broker %s is unreachable" %
+                                    brokerhost)
+
+        # connect to the broker just once for all of the tests
+        cls.topic = "testtopic"
+        cls.runid = utils.createRunId()
+        cls.sender = utils.EventSender(cls.runid, cls.topic, brokerhost)
+        cls.rcvr = EventReceiver(brokerhost, cls.topic,
+                                 "RUNID='%s'" % cls.runid)
+        cls.postisr = Dataset.fromPolicy(utils.unserializePolicy(postisrdata))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.sender = None
+        cls.rcvr = None
 
-    def _makeDataset(self):
-        return Dataset.fromPolicy(utils.unserializePolicy(postisrdata))
+    def setUp(self):
+        # discard any events a previous test left for the shared receiver
+        while self.rcvr.receiveEvent(10) is not None:
+            pass
+
+    def _makeDatasets(self):
+        # two PostISR datasets from neighboring amps; the parsed dataset is
+        # shared by the tests, so hand out copies
+        ds1 = copy.deepcopy(self.postisr)
+        ds2 = copy.deepcopy(self.postisr)
+        ds2.ids["ampid"] += 1
+        return [ds1, ds2]
 
     def testStatusEvent(self):
         status = "channel"
         ev = self.sender.createStatusEvent(status)
-        self.assertEquals(ev.getStatus(), status)
+        self.assertEqual(ev.getStatus(), status)
         ev.setProperty("pipelineName", "ccdAssembly")
-        self.assertEquals(ev.getProperty("pipelineName"), "ccdAssembly")
+        self.assertEqual(ev.getProperty("pipelineName"), "ccdAssembly")
 
         event = ev.create()
-        self.assertEquals(event.getStatus(), status)
+        self.assertEqual(event.getStatus(), status)
         origid = event.getOriginatorId()
-        self.assert_(origid != 0)
-        self.assertEquals(event.getPropertySet().getString("pipelineName"),
-                          "ccdAssembly")
+        self.assertNotEqual(origid, 0)
+        self.assertEqual(event.getPropertySet().getString("pipelineName"),
+                         "ccdAssembly")
 
-        ds = self._makeDataset()
-        ev.addDataset("inputs", ds)
-        ds.ids["ampid"] += 1
-        ev.addDataset("inputs", ds)
+        ev.addDatasets("inputs", self._makeDatasets())
 
         self.sender.send(ev.create())
         event = self.rcvr.receiveStatusEvent(1000)
-        self.assert_(event is not None, "failed to receive sent event")
-        self.assertEquals(event.getStatus(), status)
-        self.assertEquals(event.getPropertySet().getString("pipelineName"),
-                          "ccdAssembly")
-        self.assertEquals(event.getOriginatorId(), origid)
+        self.assertIsNotNone(event, "failed to receive sent event")
+        self.assertEqual(event.getStatus(), status)
+        self.assertEqual(event.getPropertySet().getString("pipelineName"),
+                         "ccdAssembly")
+        self.assertEqual(event.getOriginatorId(), origid)
         
         dslist = event.getPropertySet().getArrayString("inputs")
         if dslist is not None:
             dslist = utils.unserializeDatasetList(dslist)
-        self.assert_(dslist is not None)
-        self.assertEquals(len(dslist), 2)
-        self.assertEquals(dslist[0].type, "PostISR")
+        self.assertIsNotNone(dslist)
+        self.assertEqual(len(dslist), 2)
+        self.assertEqual(dslist[0].type, "PostISR")
         
     def testCommandEvent(self):
         dest = random.randint(1, 0xffff)
-        self.rcvr = EventReceiver(brokerhost, self.topic,
+        rcvr = EventReceiver(brokerhost, self.topic,
                        "RUNID='%s' and DESTINATIONID=%d" % (self.runid, dest))
 
         status = "channel"
         ev = self.sender.createCommandEvent(status, dest)
-        self.assertEquals(ev.getStatus(), status)
-        self.assertEquals(ev.getDestinationId(), dest)
+        self.assertEqual(ev.getStatus(), status)
+        self.assertEqual(ev.getDestinationId(), dest)
         ev.setProperty("pipelineName", "ccdAssembly")
-        self.assertEquals(ev.getProperty("pipelineName"), "ccdAssembly")
+        self.assertEqual(ev.getProperty("pipelineName"), "ccdAssembly")
 
         event = ev.create()
-        self.assertEquals(event.getStatus(), status)
-        self.assertEquals(event.getDestinationId(), dest)
+        self.assertEqual(event.getStatus(), status)
+        self.assertEqual(event.getDestinationId(), dest)
         origid = event.getOriginatorId()
-        self.assert_(origid != 0)
-        self.assertEquals(event.getPropertySet().getString("pipelineName"),
-                          "ccdAssembly")
+        self.assertNotEqual(origid, 0)
+        self.assertEqual(event.getPropertySet().getString("pipelineName"),
+                         "ccdAssembly")
 
-        ds = self._makeDataset()
-        ev.addDataset("inputs", ds)
-        ds.ids["ampid"] += 1
-        ev.addDataset("inputs", ds)
+        ev.addDatasets("inputs", self._makeDatasets())
 
         self.sender.send(ev.create())
-        event = self.rcvr.receiveCommandEvent(1000)
-        self.assert_(event is not None, "failed to receive sent event")
-        self.assertEquals(event.getStatus(), status)
-        self.assertEquals(event.getPropertySet().getString("pipelineName"),
-                          "ccdAssembly")
-        self.assertEquals(event.getOriginatorId(), origid)
-        self.assertEquals(event.getDestinationId(), dest)
+        event = rcvr.receiveCommandEvent(1000)
+        self.assertIsNotNone(event, "failed to receive sent event")
+        self.assertEqual(event.getStatus(), status)
+        self.assertEqual(event.getPropertySet().getString("pipelineName"),
+                         "ccdAssembly")
+        self.assertEqual(event.getOriginatorId(), origid)
+        self.assertEqual(event.getDestinationId(), dest)
         
         dslist = event.getPropertySet().getArrayString("inputs")
         if dslist is not None:
             dslist = utils.unserializeDatasetList(dslist)
-        self.assert_(dslist is not None)
-        self.assertEquals(len(dslist), 2)
-        self.assertEquals(dslist[0].type, "PostISR")
+        self.assertIsNotNone(dslist)
+        self.assertEqual(len(dslist), 2)
+        self.assertEqual(dslist[0].type, "PostISR")
 
     def testDatasetEvent(self):
-        ds = self._makeDataset()
-        ev = self.sender.createDatasetEvent("ccdAssembly", ds)
-        ds.ids["ampid"] += 1
-        ev.addDataset("dataset", ds)
+        ev = self.sender.createDatasetEvent("ccdAssembly",
+                                            self._makeDatasets())
         origid = ev.getOriginatorId()
 
         self.sender.send(ev)
 
         event = self.rcvr.receiveStatusEvent(1000)
-        self.assert_(event is not None, "failed to receive sent event")
-        self.assertEquals(event.getStatus(), "available")
-        self.assertEquals(event.getPropertySet().getString("pipelineName"),
-                          "ccdAssembly")
-        self.assertEquals(event.getOriginatorId(), origid)
+        self.assertIsNotNone(event, "failed to receive sent event")
+        self.assertEqual(event.getStatus(), "available")
+        self.assertEqual(event.getPropertySet().getString("pipelineName"),
+                         "ccdAssembly")
+        self.assertEqual(event.getOriginatorId(), origid)
         
         dslist = event.getPropertySet().getArrayString("dataset")
         if dslist is not None:
             dslist = utils.unserializeDatasetList(dslist)
-        self.assert_(dslist is not None)
-        self.assertEquals(len(dslist), 2)
-        self.assertEquals(dslist[0].type, "PostISR")
-        self.assert_(dslist[0].valid)
+        self.assertIsNotNone(dslist)
+        self.assertEqual(len(dslist), 2)
+        self.assertEqual(dslist[0].type, "PostISR")
+        self.assertTrue(dslist[0].valid)
 
 
 class ImporterTestCase(unittest.TestCase):
@@ -211,12 +238,18 @@ class ImporterTestCase(unittest.TestCase):
         
     def testImport(self):
         tcls = utils.importClass("lsst.ctrl.sched.joboffice.triggers.Trigger")
-        self.assert_(isinstance(tcls, type))
+        self.assertIsInstance(tcls, type)
         cls = utils.importClass("lsst.ctrl.sched.joboffice.triggers.SimpleTrigger")
-        self.assert_(issubclass(cls, tcls))
+        self.assertTrue(issubclass(cls, tcls))
+
+    def testImportCached(self):
+        clsname = "lsst.ctrl.sched.joboffice.triggers.Trigger"
+        tcls = utils.importClass(clsname)
+        self.assertIs(utils._importedClasses.get(clsname), tcls)
+        self.assertIs(utils.importClass(clsname), tcls)
 
 
-__all__ = "RunIdTestCase EventSenderTestCase ImporterTestCase".split()
+__all__ = "RunIdTestCase BrokerProbeTestCase EventSenderTestCase ImporterTestCase".split()
 
 if __name__ == "__main__":
     if len(sys.argv) > 1: